@@ -25,17 +25,27 @@ in memory, groups them by team and allows editing of names and face IDs.  A
 full editor window with placeholder tabs is available for future extensions.
 """
 
+import bisect
+import codecs
+import functools
+import itertools
+import math
+import operator
 import os
+import re
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import struct
+import zlib
 import ctypes
 from ctypes import wintypes
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict
+from types import MappingProxyType
+from typing import IO, Dict, Final, Iterable, Mapping
 import random
-import tempfile
 import urllib.request
 import urllib.parse
 import io
@@ -160,56 +170,72 @@ BADGE_NAME_TO_VALUE: dict[str, int] = {
 # range.  Ratings outside the expected range are clamped.
 
 
-def convert_raw_to_rating(raw: int, length: int) -> int:
+def _raw_to_rating_formula(raw: int, length: int) -> int:
     """Decode raw bitfield to true 25..110 rating. Honors ATTR_STORAGE_MODE.
     - 'direct': treat raw as the true rating when field is wide enough
     - 'scale' : map 0..max_raw linearly to 25..110
     """
-    try:
-        max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return RATING_MIN
-        if ATTR_STORAGE_MODE == 'direct' and max_raw >= RATING_MAX_TRUE:
-            rating = int(raw)
-        else:
-            rating = RATING_MIN + (int(raw) / max_raw) * (RATING_MAX_TRUE - RATING_MIN)
-        if rating < RATING_MIN:
-            rating = RATING_MIN
-        elif rating > RATING_MAX_TRUE:
-            rating = RATING_MAX_TRUE
-        return int(round(rating))
-    except Exception:
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
         return RATING_MIN
+    if ATTR_STORAGE_MODE == 'direct' and max_raw >= RATING_MAX_TRUE:
+        rating = raw
+    else:
+        rating = RATING_MIN + (raw / max_raw) * (RATING_MAX_TRUE - RATING_MIN)
+    return int(round(min(max(rating, RATING_MIN), RATING_MAX_TRUE)))
+
+# Field widths seen in the offsets file are small (1, 2, 3, 5 bits for badges
+# and contract fields, 8 bits for attributes), so every possible raw value of
+# those fields is decoded once here.  The tables are filled from the formula
+# above, which keeps the results identical while the hot path becomes a
+# single index instead of a shift and a divide per field.  The tables encode
+# the storage mode in effect at import; if ATTR_STORAGE_MODE is changed later
+# the formula is used instead.
+RATING_TABLE_MAX_BITS = 8
+_RATING_TABLE_MODE = ATTR_STORAGE_MODE
+_RAW_TO_RATING_TABLES: Dict[int, tuple[int, ...]] = {
+    length: tuple(_raw_to_rating_formula(raw, length) for raw in range(1 << length))
+    for length in range(1, RATING_TABLE_MAX_BITS + 1)
+}
+
+
+def convert_raw_to_rating(raw: int, length: int) -> int:
+    """Decode raw bitfield to true 25..110 rating. Honors ATTR_STORAGE_MODE.
+
+    Narrow fields are served from ``_RAW_TO_RATING_TABLES``; anything else
+    (wide fields, out-of-range or non-integer raw values) goes through
+    ``_raw_to_rating_formula``.
+    """
+    table = _RAW_TO_RATING_TABLES.get(length)
+    if (
+        table is not None
+        and type(raw) is int
+        and 0 <= raw < len(table)
+        and ATTR_STORAGE_MODE == _RATING_TABLE_MODE
+    ):
+        return table[raw]
+    return _raw_to_rating_formula(raw, length)
 
 def convert_rating_to_raw(rating: float, length: int) -> int:
-    """Encode 25..110 rating into bitfield. Honors ATTR_STORAGE_MODE."""
-    try:
-        max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return 0
-        r = float(rating)
-        if r < RATING_MIN:
-            r = RATING_MIN
-        elif r > RATING_MAX_TRUE:
-            r = RATING_MAX_TRUE
-        if ATTR_STORAGE_MODE == 'direct' and max_raw >= RATING_MAX_TRUE:
-            raw_val = int(round(r))
-        else:
-            fraction = (r - RATING_MIN) / (RATING_MAX_TRUE - RATING_MIN)
-            if fraction < 0.0:
-                fraction = 0.0
-            elif fraction > 1.0:
-                fraction = 1.0
-            raw_val = int(round(fraction * max_raw))
-        if raw_val < 0:
-            raw_val = 0
-        elif raw_val > max_raw:
-            raw_val = max_raw
-        return raw_val
-    except Exception:
-        return 0
+    """Encode 25..110 rating into bitfield. Honors ATTR_STORAGE_MODE.
 
-def convert_tendency_raw_to_rating(raw: int, length: int) -> int:
+    ``rating`` must already be a number; callers coerce user input (and
+    replace NaN, which ``round`` rejects) before calling.
+    """
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
+        return 0
+    # Clamp with the value first so a NaN propagates (and is rejected by
+    # ``round`` below) instead of silently becoming a bound.
+    r = min(max(rating, RATING_MIN), RATING_MAX_TRUE)
+    if ATTR_STORAGE_MODE == 'direct' and max_raw >= RATING_MAX_TRUE:
+        raw_val = int(round(r))
+    else:
+        fraction = (r - RATING_MIN) / (RATING_MAX_TRUE - RATING_MIN)
+        raw_val = int(round(fraction * max_raw))
+    return min(max(raw_val, 0), max_raw)
+
+def _tendency_raw_to_rating_formula(raw: int, length: int) -> int:
     """
     Convert a raw bitfield value into a 0–100 tendency rating.  When the
     game stores tendency values in a bitfield of ``length`` bits, the
@@ -230,19 +256,35 @@ def convert_tendency_raw_to_rating(raw: int, length: int) -> int:
         Rating on the 0–100 scale, rounded to the nearest integer and
         clamped to 0..100.
     """
-    try:
-        max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return 0
-        # Proportional mapping: raw 0..max_raw maps to 0..100
-        rating = (raw / max_raw) * 100.0
-        if rating < 0.0:
-            rating = 0.0
-        elif rating > 100.0:
-            rating = 100.0
-        return int(round(rating))
-    except Exception:
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
         return 0
+    # Proportional mapping: raw 0..max_raw maps to 0..100
+    rating = (raw / max_raw) * 100.0
+    return int(round(min(max(rating, 0.0), 100.0)))
+
+
+# Tendency fields are decoded the same way as ratings: every raw value of a
+# field up to RATING_TABLE_MAX_BITS wide is converted once at import, so the
+# full editor's first load does not pay for the arithmetic.
+_TENDENCY_RAW_TO_RATING_TABLES: Dict[int, tuple[int, ...]] = {
+    length: tuple(
+        _tendency_raw_to_rating_formula(raw, length) for raw in range(1 << length)
+    )
+    for length in range(1, RATING_TABLE_MAX_BITS + 1)
+}
+
+
+def convert_tendency_raw_to_rating(raw: int, length: int) -> int:
+    """Convert a raw bitfield value into a 0–100 tendency rating.
+
+    Narrow fields are served from ``_TENDENCY_RAW_TO_RATING_TABLES``;
+    anything else goes through ``_tendency_raw_to_rating_formula``.
+    """
+    table = _TENDENCY_RAW_TO_RATING_TABLES.get(length)
+    if table is not None and type(raw) is int and 0 <= raw < len(table):
+        return table[raw]
+    return _tendency_raw_to_rating_formula(raw, length)
 
 
 def convert_rating_to_tendency_raw(rating: float, length: int) -> int:
@@ -265,28 +307,126 @@ def convert_rating_to_tendency_raw(rating: float, length: int) -> int:
     int
         Raw bitfield value corresponding to the rating.
     """
-    try:
-        max_raw = (1 << length) - 1
-        if max_raw <= 0:
-            return 0
-        r = float(rating)
-        if r < 0.0:
-            r = 0.0
-        elif r > 100.0:
-            r = 100.0
-        fraction = r / 100.0
-        if fraction < 0.0:
-            fraction = 0.0
-        elif fraction > 1.0:
-            fraction = 1.0
-        raw_val = round(fraction * max_raw)
-        if raw_val < 0:
-            raw_val = 0
-        elif raw_val > max_raw:
-            raw_val = max_raw
-        return int(raw_val)
-    except Exception:
+    max_raw = (1 << length) - 1
+    if max_raw <= 0:
         return 0
+    fraction = min(max(rating, 0.0), 100.0) / 100.0
+    return min(max(int(round(fraction * max_raw)), 0), max_raw)
+
+
+@functools.lru_cache(maxsize=64)
+def _bitfield_plan(
+    specs: tuple[tuple[int, int, int], ...], base_offset: int
+) -> tuple[tuple[int, int, tuple[tuple[int, int, int], ...]], ...]:
+    """
+    Group bit fields into 8‑byte windows for ``decode_bitfields``.
+
+    Neighbouring fields (e.g. the contract options packed into a few bytes
+    around 0x300) share one window, so the record bytes behind them are
+    converted to an integer once and each field is then a shift and a mask.
+    A field wider than a window gets a window of its own.
+
+    Returns ``(start, end, fields)`` windows, where ``start``/``end`` index
+    the record buffer and ``fields`` holds ``(output_index, shift, mask)``.
+    """
+    order = sorted(range(len(specs)), key=lambda k: specs[k][0])
+    windows: list[tuple[int, int, tuple[tuple[int, int, int], ...]]] = []
+    start = end = 0
+    fields: list[tuple[int, int, int]] = []
+    for k in order:
+        offset, start_bit, length = specs[k]
+        pos = offset - base_offset
+        field_end = pos + (start_bit + length + 7) // 8
+        if fields and field_end - start > 8:
+            windows.append((start, end, tuple(fields)))
+            fields = []
+        if not fields:
+            start = end = pos
+        end = max(end, field_end)
+        fields.append((k, (pos - start) * 8 + start_bit, (1 << length) - 1))
+    if fields:
+        windows.append((start, end, tuple(fields)))
+    return tuple(windows)
+
+
+def decode_bitfields(
+    record: bytes, specs: list[tuple[int, int, int]], base_offset: int = 0
+) -> list[int]:
+    """
+    Extract several bit fields from one in‑memory copy of a player record.
+
+    The full editor shows a few hundred fields per player.  Decoding them
+    all from a single buffer avoids a ReadProcessMemory round trip per
+    field; the conversion helpers above are then applied to the results.
+    Fields are decoded per 8‑byte window (see ``_bitfield_plan``), which is
+    cached for the field lists the editor uses repeatedly.
+
+    Parameters
+    ----------
+    record : bytes
+        Raw record bytes.  ``record[0]`` corresponds to ``base_offset``
+        within the player record.
+    specs : list[tuple[int, int, int]]
+        ``(offset, start_bit, length)`` tuples, where ``offset`` is relative
+        to the start of the player record.
+    base_offset : int
+        Record offset of the first byte in ``record``.
+
+    Returns
+    -------
+    list[int]
+        The raw value of each bit field, in the order of ``specs``.
+    """
+    from_bytes = int.from_bytes
+    values: list[int] = [0] * len(specs)
+    for start, end, fields in _bitfield_plan(tuple(specs), base_offset):
+        word = from_bytes(record[start:end], "little")
+        for k, shift, mask in fields:
+            values[k] = (word >> shift) & mask
+    return values
+
+
+@functools.lru_cache(maxsize=64)
+def _bitfield_write_plan(
+    specs: tuple[tuple[int, int, int], ...]
+) -> tuple[int, int, tuple[tuple[int, int, int, int, int], ...], tuple[tuple[int, int], ...]]:
+    """
+    Precompute the byte ranges and masks for writing the fields in ``specs``.
+
+    ``specs`` holds ``(offset, start_bit, length)`` tuples.  Returns
+    ``(lo, size, fields, runs)``: the covering byte range starts at record
+    offset ``lo`` and is ``size`` bytes long; ``fields`` gives, per spec,
+    ``(start, end, max_value, shift, clear_mask)`` where ``start:end`` is
+    the field's byte slice of that range and ``clear_mask`` zeroes its bits
+    within those bytes; ``runs`` are the merged ``(start, end)`` slices of
+    bytes touched by any field.  An import writes the same columns for
+    every player, so the plan is cached.
+    """
+    spans = [
+        (offset, offset + (start_bit + length + 7) // 8)
+        for offset, start_bit, length in specs
+    ]
+    lo = min(start for start, _ in spans)
+    hi = max(end for _, end in spans)
+    fields = []
+    for (offset, start_bit, length), (start, end) in zip(specs, spans):
+        max_value = (1 << length) - 1
+        width = (1 << (8 * (end - start))) - 1
+        clear_mask = width & ~(max_value << start_bit)
+        fields.append((start - lo, end - lo, max_value, start_bit, clear_mask))
+    # Merge the touched byte ranges into contiguous runs
+    runs: list[list[int]] = []
+    for start, end in sorted(spans):
+        if runs and start <= runs[-1][1]:
+            runs[-1][1] = max(runs[-1][1], end)
+        else:
+            runs.append([start, end])
+    return (
+        lo,
+        hi - lo,
+        tuple(fields),
+        tuple((start - lo, end - lo) for start, end in runs),
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -436,6 +576,122 @@ COY_SHEET_TABS: dict[str, str] = {
     "Durability": "Durabilities",
 }
 
+
+def _coy_sheet_url(sheet_name: str) -> str:
+    """Return the CSV export URL of ``sheet_name`` in the COY Google Sheet."""
+    return (
+        f"https://docs.google.com/spreadsheets/d/{COY_SHEET_ID}/"
+        f"gviz/tq?tqx=out:csv&sheet={urllib.parse.quote(sheet_name)}"
+    )
+
+
+def _fetch_coy_sheet(sheet_name: str) -> list[list[str]]:
+    """Download one COY sheet and return its parsed CSV rows.
+
+    The HTTP response is decoded and parsed incrementally by wrapping it in a
+    ``TextIOWrapper`` for ``csv.reader``, instead of reading and decoding the
+    whole body into one string first.  Sheet exports include the unused rows
+    of the grid, so data rows without a player name are dropped as they are
+    parsed rather than kept in the result; the header row is always kept.
+    Returns an empty list if the sheet cannot be fetched or decoded.  Safe
+    to call from worker threads.
+    """
+    import csv as _csv
+
+    try:
+        with urllib.request.urlopen(_coy_sheet_url(sheet_name), timeout=30) as resp:
+            text = io.TextIOWrapper(resp, encoding="utf-8", newline="")
+            reader = _csv.reader(text)
+            header = next(reader, None)
+            if header is None:
+                return []
+            rows = [header]
+            rows.extend(row for row in reader if row and row[0].strip())
+            return rows
+    except Exception:
+        return []
+
+def _open_excel_workbook(workbook_path: str):
+    """Open an Excel workbook for the Excel import.
+
+    Returns ``(sheet_names, read_sheet, close)`` where ``read_sheet(name)`` returns
+    the rows of that sheet as lists of strings (header first), shaped like a
+    CSV export: empty cells are ``""`` and unnamed header cells are
+    ``"Unnamed: <column>"`` as pandas labels them.  ``.xlsx`` files are read
+    with openpyxl in read-only mode when it is installed; otherwise, or if
+    openpyxl fails, pandas is used.  Raises if neither can open the file.
+    ``close()`` releases the file once all sheets have been read.
+    """
+    import csv as _csv
+
+    if _openpyxl is not None and workbook_path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            wb = _openpyxl.load_workbook(workbook_path, read_only=True, data_only=True)
+        except Exception:
+            wb = None
+        if wb is not None:
+
+            def read_sheet(name: str) -> list[list[str]]:
+                rows = wb[name].iter_rows(values_only=True)
+                header = next(rows, None)
+                if header is None:
+                    return []
+                out = [
+                    [
+                        f"Unnamed: {col}" if v is None else str(v)
+                        for col, v in enumerate(header)
+                    ]
+                ]
+                out.extend(
+                    ["" if v is None else str(v) for v in row] for row in rows
+                )
+                return out
+
+            return wb.sheetnames, read_sheet, wb.close
+
+    import pandas as _pd
+
+    xls = _pd.ExcelFile(workbook_path)
+
+    def read_sheet(name: str) -> list[list[str]]:
+        try:
+            df = xls.parse(name)
+        except Exception:
+            # Attempt to read via pandas.read_excel fallback
+            df = _pd.read_excel(workbook_path, sheet_name=name)
+        # Render the DataFrame as CSV text and parse it back into rows in
+        # memory; the cell formatting is the same as a CSV file written by
+        # pandas.
+        return list(_csv.reader(io.StringIO(df.to_csv(index=False))))
+
+    return xls.sheet_names, read_sheet, xls.close
+
+
+def _player_name_key(name: str) -> str:
+    """Return the ``PlayerDataModel.name_index_map`` key for a full name.
+
+    Runs of whitespace (including leading and trailing) collapse to single
+    spaces and the result is case-folded, so "LeBron  James " and
+    "lebron james" share one key.  Both the index and every lookup go through
+    this function, and each name is normalized exactly once.
+    """
+    return " ".join(name.split()).casefold()
+
+
+def _table_player_names(rows: list[list[str]]) -> dict[str, str]:
+    """Return the players named in column 0 of ``rows``, keyed by name key.
+
+    ``rows`` is a table as returned by ``read_table_rows`` or a sheet reader;
+    the first row is the header and blank rows or names are skipped.  Each
+    key (see ``_player_name_key``) maps to the name as spelled in the table,
+    for reporting.  The names are gathered in one comprehension over the
+    rows already in memory, so no file is parsed a second time.
+    """
+    names = {_player_name_key(row[0]): row[0].strip() for row in rows[1:] if row}
+    names.pop("", None)
+    return names
+
+
 # Constants for the team table and pointer chains.  These values were
 # initially derived from the Cheat Engine "Team Data" table for Patch 4,
 # but NBA 2K25 has been observed to change them across updates.  To
@@ -466,6 +722,23 @@ TEAM_NAME_LENGTH = 24
 TEAM_TYPE_OFFSET = 0x12F7
 # Historic year bitfield (bits 3..9).  Non-zero only for historic teams.
 TEAM_YEAR_OFFSET = 0x161A
+# Lookup tables for the two bitfields above, indexed by raw byte value.
+# The roster type is ``(byte >> 2) & 0x1F``.  The year spans two bytes,
+# ``((hi << 8 | lo) >> 3) & 0x7F``, which splits into ``lo >> 3`` (year
+# bits 0..4) OR'd with ``(hi & 0x03) << 5`` (year bits 5..6).
+TEAM_TYPE_LUT = bytes((b >> 2) & 0x1F for b in range(256))
+TEAM_YEAR_LUT_LO = bytes(b >> 3 for b in range(256))
+TEAM_YEAR_LUT_HI = bytes((b & 0x03) << 5 for b in range(256))
+# The fields a team scan needs -- the raw name bytes, the roster type byte
+# and the two bytes holding the year -- as one record of TEAM_STRIDE bytes.
+# ``iter_unpack`` over the scanned block pulls them out of every record in C
+# instead of slicing and indexing the block per team.
+_TEAM_SCAN_RECORD = struct.Struct(
+    f"<{TEAM_NAME_OFFSET}x{TEAM_NAME_LENGTH * 2}s"
+    f"{TEAM_TYPE_OFFSET - TEAM_NAME_OFFSET - TEAM_NAME_LENGTH * 2}xB"
+    f"{TEAM_YEAR_OFFSET - TEAM_TYPE_OFFSET - 1}xBB"
+    f"{TEAM_STRIDE - TEAM_YEAR_OFFSET - 2}x"
+)
 # Maximum number of player pointers stored per team.  2K typically stores
 # up to 20 players for NBA teams.
 TEAM_PLAYER_SLOT_COUNT = 20
@@ -480,8 +753,8 @@ TEAM_PLAYER_SLOT_COUNT = 20
 # Maximum number of team records to scan.  NBA 2K25 includes current NBA
 # teams, All‑Time teams, classic teams and G‑League teams.  To capture
 # rosters from all available teams (including user‑created teams), bump
-# this limit to 300.  Scanning beyond the actual number of teams simply
-# stops when an empty record is encountered.
+# this limit to 300.  Every one of these records is scanned; records beyond
+# the actual number of teams have empty or invalid names and are skipped.
 MAX_TEAMS_SCAN = 300
 
 # Candidate pointer chains for resolving the base of the team table.  Each
@@ -496,6 +769,12 @@ TEAM_PTR_CHAINS: list[tuple[int, int, bool]] = [
     (0x07DFFAC0, 0x0, False),
 ]
 
+# The first pointer of every player and team chain lives in the module
+# image, and several chains share a root (0x07E39430 above).  Roots within
+# this many bytes of each other are fetched with a single read when the
+# chains are probed; see ``PlayerDataModel._chain_root``.
+CHAIN_ROOT_READ_SPAN = 0x1000
+
 # -----------------------------------------------------------------------------
 # Definitions for editing team metadata.  These constants describe where
 # various pieces of information about a team are stored within a team
@@ -560,6 +839,17 @@ LEN_TENDENCIES = 99
 OFF_BADGES = 0x42A  # badges/personality block
 LEN_BADGES = 19
 
+# Copyable blocks keyed by the category names accepted by
+# ``PlayerDataModel.copy_player_data``.  Each value is ``(offset, length)``
+# within the player record.  ``"full"`` is handled separately because it
+# depends on ``PLAYER_STRIDE``, which may be overridden at start‑up.
+PLAYER_COPY_BLOCKS: dict[str, tuple[int, int]] = {
+    "appearance": (OFF_APPEARANCE, LEN_APPEARANCE),
+    "attributes": (OFF_ATTRIBUTES, LEN_ATTRIBUTES),
+    "tendencies": (OFF_TENDENCIES, LEN_TENDENCIES),
+    "badges": (OFF_BADGES, LEN_BADGES),
+}
+
 # -----------------------------------------------------------------------------
 # Import table definitions
 #
@@ -744,6 +1034,276 @@ TEND_IMPORT_ORDER = [
     "T/CONTEST",
 ]
 
+# Header abbreviations used by import files, keyed by their normalized form
+# and mapped to the normalized field name in the offset map.  See
+# ``PlayerDataModel._normalize_header_name``.  The public name is a
+# read-only view; lookups go to the private dict directly so each call is a
+# plain ``dict.get`` rather than a call forwarded through the proxy.
+_HEADER_SYNONYMS: Final[Dict[str, str]] = {
+    "LAYUP": "DRIVINGLAYUP",
+    "STDUNK": "STANDINGDUNK",
+    "DUNK": "DRIVINGDUNK",
+    "CLOSE": "CLOSESHOT",
+    "MID": "MIDRANGESHOT",
+    "3PT": "3PTSHOT",
+    "FT": "FREETHROW",
+    "PHOOK": "POSTHOOK",
+    "PFADE": "POSTFADE",
+    "POSTC": "POSTMOVES",
+    "FOUL": "DRAWFOUL",
+    "BALL": "BALLCONTROL",
+    "SPDBALL": "SPEEDWITHBALL",
+    "PASSIQ": "PASSINGIQ",
+    "PASS_IQ": "PASSINGIQ",
+    "VISION": "PASSINGVISION",
+    "OCNST": "OFFENSIVECONSISTENCY",
+    "ID": "INTERIORDEFENSE",
+    "PD": "PERIMETERDEFENSE",
+    "STEAL": "STEAL",
+    "BLOCK": "BLOCK",
+    "OREB": "OFFENSIVEREBOUND",
+    "DREB": "DEFENSIVEREBOUND",
+    "HELPIQ": "HELPDEFENSEIQ",
+    "PSPER": "PASSINGPERCEPTION",
+    "DCNST": "DEFENSIVECONSISTENCY",
+    "SPEED": "SPEED",
+    "AGIL": "AGILITY",
+    "STR": "STRENGTH",
+    "VERT": "VERTICAL",
+    "STAM": "STAMINA",
+    "INTNGBL": "INTANGIBLES",
+    "HSTL": "HUSTLE",
+    "DUR": "MISCELLANEOUSDURABILITY",
+    "POT": "POTENTIAL",
+    # Durability synonyms
+    "BACK": "BACKDURABILITY",
+    "HEAD": "HEADDURABILITY",
+    "LEFTANKLE": "LEFTANKLEDURABILITY",
+    "LEFTELBOW": "LEFTELBOWDURABILITY",
+    "LEFTFOOT": "LEFTFOOTDURABILITY",
+    "LEFTHIP": "LEFTHIPDURABILITY",
+    "LEFTKNEE": "LEFTKNEEDURABILITY",
+    "LEFTSHOULDER": "LEFTSHOULDERDURABILITY",
+    "NECK": "NECKDURABILITY",
+    "RIGHTANKLE": "RIGHTANKLEDURABILITY",
+    "RIGHTELBOW": "RIGHTELBOWDURABILITY",
+    "RIGHTFOOT": "RIGHTFOOTDURABILITY",
+    "RIGHTHIP": "RIGHTHIPDURABILITY",
+    "RIGHTKNEE": "RIGHTKNEEDURABILITY",
+    "RIGHTSHOULDER": "RIGHTSHOULDERDURABILITY",
+    "MISCELLANEOUS": "MISCELLANEOUSDURABILITY",
+    "MISCELLANEOUSDURABILITY": "MISCELLANEOUSDURABILITY",
+    # Tendencies abbreviations (T/ prefixed) mapped to canonical field names.
+    # These mappings allow the importer to align columns from the
+    # Tendencies spreadsheet with the corresponding field names in
+    # the offset map.  Each key is the normalized abbreviation (no
+    # punctuation); the value is the normalized field name
+    # (uppercase, no spaces) used in the offset map.  This list
+    # covers all abbreviations that appear in the user's sheet.
+    # Abbreviation mappings for shooting/finishing
+    "TSHOT": "SHOOT",  # generic Shot -> Shoot (from user: shot = shoot)
+    "TTOUCH": "TOUCHES",
+    "TSCLOSE": "SHOTCLOSE",
+    "TSUNDER": "SHOTUNDERBASKET",
+    "TSCL": "SHOTCLOSELEFT",
+    "TSCM": "SHOTCLOSEMIDDLE",
+    "TSCR": "SHOTCLOSERIGHT",
+    "TSMID": "SHOTMID",
+    "TSUSMID": "SPOTUPSHOTMID",
+    "TOSSMID": "OFFSCREENSHOTMID",
+    "TSML": "SHOTMIDLEFT",
+    "TSMLC": "SHOTMIDLEFTCENTER",
+    "TSMC": "SHOTMIDCENTER",
+    "TSMRC": "SHOTMIDRIGHTCENTER",
+    "TSMR": "SHOTMIDRIGHT",
+    "TS3PT": "SHOT3PT",
+    "TSUS3PT": "SPOTUPSHOT3PT",
+    "TOSS3PT": "OFFSCREENSHOT3PT",
+    "TS3L": "SHOT3PTLEFT",
+    "TS3LC": "SHOT3PTLEFTCENTER",
+    "TS3C": "SHOT3PTCENTER",
+    "TS3RC": "SHOT3PTRIGHTCENTER",
+    "TS3R": "SHOT3PTRIGHT",
+    "TCONTMID": "CONTESTEDJUMPERMID",
+    "TCONT3PT": "CONTESTEDJUMPER3PT",
+    "TSBMID": "STEPBACKJUMPERMID",
+    "TSB3PT": "STEPBACKJUMPER3PT",
+    # Spin Jumper tendency abbreviation
+    "TSPINJ": "SPINJUMPERTENDENCY",
+    # Transition pull‑up 3pt (not drive)
+    "TTPU3PT": "TRANSITIONPULLUP3PT",
+    "TDPUMID": "DRIVEPULLUPMID",
+    "TDPU3PT": "DRIVEPULLUP3PT",
+    "TDRIVE": "DRIVE",
+    "TSUDRIVE": "SPOTUPDRIVE",
+    "TOSDRIVE": "OFFSCREENDRIVE",
+    # Use Glass tendency; map to USEGLASS rather than Crash
+    "TGLASS": "USEGLASS",
+    "TSTHRU": "STEPTHROUGHSHOT",
+    "TDRLAYUP": "DRIVINGLAYUPTENDENCY",
+    "TSPLAYUP": "STANDINGLAYUPTENDENCY",
+    "TEURO": "EUROSTEP",
+    "THOPSTEP": "HOPSTEP",
+    "TFLOATER": "FLOATER",
+    "TSDUNK": "STANDINGDUNKTENDENCY",
+    "TDDUNK": "DRIVINGDUNKTENDENCY",
+    "TFDUNK": "FLASHYDUNKTENDENCY",
+    # Alley‑oop dunk tendency
+    "TAOOP": "ALLEYOOP",
+    "TPUTBACK": "PUTBACK",
+    "TCRASH": "CRASH",
+    # Drive‑R abbreviation represents Drive Right
+    "TDRIVER": "DRIVERIGHT",
+    "TTTPFAKE": "TRIPLETHREATPUMPFAKE",
+    "TJABSTEP": "TRIPLETHREATJABSTEP",
+    "TTTIDLE": "TRIPLETHREATIDLE",
+    "TTTSHOOT": "TRIPLETHREATSHOOT",
+    # Setup moves (Sizeup and Hesitation) and no setup
+    "TSIZEUP": "SETUPWITHSIZEUP",
+    "THSTTN": "SETUPWITHHESITATION",
+    "TNOSETUP": "NOSETUPDRIBBLE",
+    # Dribble move abbreviations map to their driving variants
+    "TXOVER": "DRIVINGCROSSOVER",
+    "T2XOVER": "DRIVINGDOUBLECROSSOVER",
+    # TSPIN abbreviation corresponds to the driving spin dribble move
+    "TSPIN": "DRIVINGSPIN",
+    # Half spin corresponds to driving half spin
+    "THSPIN": "DRIVINGHALFSPIN",
+    # Stepback corresponds to driving stepback
+    "TSBACK": "DRIVINGSTEPBACK",
+    # Behind‑the‑back corresponds to driving behind the back
+    "TBBACK": "DRIVINGBEHINDBACK",
+    # Double hesitation corresponds to driving dribble hesitation
+    "TDHSTTN": "DRIVINGDRIBBLEHESITATION",
+    "TINNOUT": "INANDOUT",
+    "TNODRIB": "NODRIBBLE",
+    "TFINISH": "ATTACKSTRONGONDRIVE",  # finish = attack strong on drive
+    "TDISH": "DISHTOOPENMAN",  # dish = dish to open man
+    "TFLASHYP": "FLASHYPASS",
+    "TAOOPP": "ALLEYOOPPASS",
+    # Roll vs Pop ratio (pick and roll) maps to RollVsPop
+    "TROLLPOP": "ROLLVSPOP",
+    "TSPOTCUT": "SPOTUPCUT",
+    "TISOVSE": "ISOVSE",
+    "TISOVSG": "ISOVSG",
+    "TISOVSA": "ISOVSA",
+    "TISOVSP": "ISOVSP",
+    "TPLYDISC": "PLAYDISCIPLINE",
+    "TPOSTUP": "POSTUP",
+    "TPBDOWN": "POSTBACKDOWN",
+    "TPAGGBD": "POSTAGGRESSIVEBACKDOWN",
+    "TPFACEUP": "POSTFACEUP",
+    "TPSPIN": "POSTSPIN",
+    "TPDRIVE": "POSTDRIVE",
+    "TPDSTEP": "POSTDROPSTEP",
+    "TPHSTEP": "POSTHOPSTEP",
+    "TPSHOOT": "POSTSHOT",
+    "TPHOOKL": "POSTHOOKLEFT",
+    "TPHOOKR": "POSTHOOKRIGHT",
+    "TPFADEL": "POSTFADELEFT",
+    "TPFADER": "POSTFADERIGHT",
+    "TPSHIMMY": "POSTSHIMMY",
+    "TPHSHOT": "POSTHOPSHOT",
+    "TPSBSHOT": "POSTSTEPBACKSHOT",
+    "TPUPNUND": "POSTUPANDUNDER",
+    "TTAKEC": "TAKECHARGE",
+    # General foul tendency
+    "TFOUL": "FOUL",
+    "THFOUL": "HARDFOUL",
+    # Pass Interception tendency
+    "TPINTERC": "PASSINTERCEPTION",
+    "TSTEAL": "STEAL",
+    "TBLOCK": "BLOCK",
+    "TCONTEST": "CONTEST",
+}
+HEADER_SYNONYMS: Final[Mapping[str, str]] = MappingProxyType(_HEADER_SYNONYMS)
+
+# ``_normalize_name`` upper-cases a header or field name and keeps only ASCII
+# letters and digits.  Encoding to ASCII with ``ignore`` drops every
+# non-ASCII character (rare; e.g. an accented header), and the remaining
+# punctuation is deleted with ``bytes.translate``, a plain 256-entry table
+# scan in C that is several times faster than ``str.translate``.
+_NORMALIZE_DELETE = bytes(c for c in range(128) if not chr(c).isalnum())
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: object) -> str:
+    """Return ``name`` upper-cased with everything but ``A-Z0-9`` removed.
+
+    Results are memoized: an import normalizes the same few hundred headers
+    and field names over and over.
+    """
+    data = str(name).upper().encode("ascii", "ignore")
+    return data.translate(None, _NORMALIZE_DELETE).decode("ascii")
+
+
+def _fuzzy_name_matcher(norm_names: list[str]):
+    """Return ``match(hdr, used=None)`` for the normalized names ``norm_names``.
+
+    ``match(hdr)`` gives the index of the first name that equals ``hdr``,
+    contains it, or is contained in it, or -1 if there is none.  This is the
+    header-to-field rule used by imports; instead of testing every name in
+    turn, names containing ``hdr`` are found with ``str.find`` over all
+    names joined by NUL (which normalized names never contain, so a hit
+    cannot straddle two names), and names contained in ``hdr`` by looking up
+    its substrings of the lengths that actually occur in ``norm_names``.
+    ``used`` is an optional ``bytearray`` with one flag byte per name;
+    flagged (non-zero) names are skipped, as when fields are claimed one
+    header at a time.
+    """
+    joined = "\x00".join(norm_names)
+    starts: list[int] = []
+    pos = 0
+    where: dict[str, list[int]] = {}
+    for i, n in enumerate(norm_names):
+        starts.append(pos)
+        pos += len(n) + 1
+        where.setdefault(n, []).append(i)
+    lengths = sorted({len(n) for n in where})
+    count = len(norm_names)
+
+    def match(hdr: str, used: bytearray | None = None) -> int:
+        if not count:
+            return -1
+        best = count
+        # First name containing ``hdr`` (including an exact match)
+        hit = joined.find(hdr)
+        while hit != -1:
+            k = bisect.bisect_right(starts, hit) - 1
+            if used is None or not used[k]:
+                best = k
+                break
+            if k + 1 >= count:
+                break
+            hit = joined.find(hdr, starts[k + 1])
+        # Names that are substrings of ``hdr``
+        size = len(hdr)
+        for length in lengths:
+            if length > size:
+                break
+            for a in range(size - length + 1):
+                hits = where.get(hdr[a : a + length])
+                if hits is None:
+                    continue
+                for i in hits:
+                    if i >= best:
+                        break
+                    if used is None or not used[i]:
+                        best = i
+                        break
+        return best if best < count else -1
+
+    return match
+
+# ASCII bytes that are not letters; deleting them from an ASCII name leaves
+# only its letters (see ``PlayerDataModel._is_printable_ascii``).
+_ASCII_NON_LETTERS = bytes(c for c in range(128) if not chr(c).isalpha())
+
+
+# Characters stripped from imported cell values before they are parsed as
+# numbers (percent signs, spaces, etc.); compiled once for the import loop.
+_IMPORT_VALUE_STRIP_RE = re.compile(r"[^0-9.-]")
+
 # -----------------------------------------------------------------------------
 # Attempt to override hard‑coded offsets from a configuration file.
 #
@@ -756,8 +1316,27 @@ TEND_IMPORT_ORDER = [
 import json as _json
 import pathlib as _pathlib
 
+# orjson parses the unified offsets files several times faster than the
+# standard library; it is optional and ``json`` is used when it is missing.
+try:
+    import orjson as _fastjson
+except Exception:
+    _fastjson = None
+
+
+# openpyxl streams .xlsx sheets row by row, so the Excel import does not need
+# to load pandas (slow to import and memory hungry) or build DataFrames.  It
+# is optional; pandas is used when it is missing or cannot read the file.
+try:
+    import openpyxl as _openpyxl
+except Exception:
+    _openpyxl = None
+
 
 # ---- Robust base directory resolver (script or PyInstaller) ----
+# The path helpers below are memoized: the install location does not change
+# while the tool runs, so the filesystem is only consulted on the first call.
+@functools.lru_cache(maxsize=None)
 def _app_base_dir():
     import os, sys, pathlib
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -766,6 +1345,7 @@ def _app_base_dir():
 # ----------------------------------------------------------------
 
 # ---------- Robust Offsets path resolver (minimal, non-invasive) ----------
+@functools.lru_cache(maxsize=None)
 def _find_offsets_path():
     import os, sys
     base = getattr(sys, "_MEIPASS", os.path.dirname(__file__))
@@ -781,6 +1361,7 @@ def _find_offsets_path():
 # --------------------------------------------------------------------------
 
 # ---- Resource path helper (works in PyInstaller onefile/onedir and dev) ----
+@functools.lru_cache(maxsize=None)
 def _resource_path(relative_name: str) -> str:
     import os, sys
     base = getattr(sys, '_MEIPASS', os.path.dirname(__file__))
@@ -800,8 +1381,121 @@ def _resource_path(relative_name: str) -> str:
 # If no unified file exists or it cannot be parsed, it returns an empty
 # dictionary.
 
+# Parsing and restructuring Offsets.txt happens on every start‑up.  The
+# resulting category lists are cached next to the offsets file as JSON (plain
+# data only, so a tampered cache cannot run code when loaded) tagged with the
+# cache format version, a fingerprint of the parsing code and the source
+# file's modification time and size; while those match, the cache is loaded
+# instead of re‑parsing the text.  Any problem reading or writing the cache
+# silently falls back to a normal parse.
+OFFSETS_CACHE_SUFFIX = ".cache.json"
+# Bump when the cached structure or the restructuring in ``_load_categories``
+# changes in a way the parser fingerprint below might not catch.
+OFFSETS_CACHE_VERSION = 2
+
+
+def _offsets_parser_fingerprint() -> str:
+    """Identify the code that turns Offsets.txt into category lists.
+
+    From source this is a CRC of ``offsets_reader.py`` and of this module;
+    in a frozen build, where the sources are packed into the executable, it
+    is the executable's modification time and size.  An update that changes
+    the parser therefore invalidates caches left in the install directory.
+    """
+    if getattr(sys, "frozen", False):
+        st = os.stat(sys.executable)
+        return f"exe:{st.st_mtime_ns}:{st.st_size}"
+    crc = 0
+    for module_file in (getattr(offsets_reader, "__file__", None), __file__):
+        if module_file:
+            with open(module_file, "rb") as f:
+                crc = zlib.crc32(f.read(), crc)
+    return f"src:{crc:08x}"
+
+
+def _offsets_cache_key(path: _pathlib.Path) -> list:
+    st = path.stat()
+    return [
+        OFFSETS_CACHE_VERSION,
+        _offsets_parser_fingerprint(),
+        st.st_mtime_ns,
+        st.st_size,
+    ]
+
+
+def _read_offsets_cache(
+    path: _pathlib.Path, key: list
+) -> dict[str, list[dict]] | None:
+    """Return cached categories for ``path`` if the cache matches ``key``."""
+    cache_path = path.with_name(path.name + OFFSETS_CACHE_SUFFIX)
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        payload = (_fastjson or _json).loads(data)
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != key:
+        return None
+    categories = payload.get("categories")
+    return categories if isinstance(categories, dict) and categories else None
+
+
+def _write_offsets_cache(
+    path: _pathlib.Path, key: list, categories: dict[str, list[dict]]
+) -> None:
+    """Store ``categories`` parsed from ``path`` in the sibling cache file."""
+    cache_path = path.with_name(path.name + OFFSETS_CACHE_SUFFIX)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            _json.dump({"key": key, "categories": categories}, f)
+    except Exception:
+        # The application directory may be read‑only; caching is optional.
+        pass
+
+
+def _intern_categories(categories: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """Intern category keys and field names in place and return ``categories``.
+
+    The same few hundred names are used as dict keys and compared over and
+    over by the editor windows; interned strings make those lookups an
+    identity check and let duplicates share one object.
+    """
+    for cat in list(categories):
+        fields = categories.pop(cat)
+        for field in fields:
+            name = field.get("name")
+            if isinstance(name, str):
+                field["name"] = sys.intern(name)
+        categories[sys.intern(cat)] = fields
+    return categories
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse the JSON file at ``path_str``; memoized on its mtime and size.
+
+    ``_load_categories`` and ``_load_offset_overrides`` both read the
+    unified offsets files (the latter at import time, the former for every
+    model).  The stat values are part of the cache key so an edited file is
+    parsed again.  Callers must not mutate the returned object.
+    """
+    with open(path_str, "rb") as f:
+        data = f.read()
+    if _fastjson is not None:
+        try:
+            return _fastjson.loads(data)
+        except ValueError:
+            # orjson is stricter (e.g. it rejects NaN literals); let the
+            # standard parser decide.
+            pass
+    return _json.loads(data)
 
 
+def _load_json_file(path: _pathlib.Path):
+    """Return the parsed contents of ``path`` via ``_read_json_cached``."""
+    st = path.stat()
+    return _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
 def _load_categories() -> dict[str, list[dict]]:
     """
@@ -817,6 +1511,10 @@ def _load_categories() -> dict[str, list[dict]]:
             for fname in ("Offsets.txt", "Offsets"):
                 off_path = base_dir / fname
                 if off_path.is_file():
+                    cache_key = _offsets_cache_key(off_path)
+                    cached = _read_offsets_cache(off_path, cache_key)
+                    if cached is not None:
+                        return _intern_categories(cached)
                     raw = offsets_reader.load_offsets(off_path)
                     rs  = offsets_reader.restructure(raw)
                     categories: dict[str, list[dict]] = {}
@@ -844,31 +1542,55 @@ def _load_categories() -> dict[str, list[dict]]:
                                     lst.append(fd)
                             categories[cat] = lst
                     if categories:
-                        return categories
+                        _write_offsets_cache(off_path, cache_key, categories)
+                        return _intern_categories(categories)
     except Exception:
         pass
 
     # Fallback: try unified offsets JSONs for dev convenience
+    _, unified = _load_unified()
+    if unified:
+        # Copy the lists: the parsed data is cached and the model appends
+        # extra fields to its categories.
+        return _intern_categories({cat: list(v) for cat, v in unified.items()})
+    return {}
+
+
+def _load_unified() -> tuple[dict[str, str] | None, dict[str, list[dict]]]:
+    """
+    Read the ``Base`` overrides and the categories from the unified files.
+
+    The candidates in ``UNIFIED_FILES`` are visited once, in order; the
+    ``Base`` section comes from the first file that has one and the
+    categories from the first file that defines any.  Both
+    ``_load_offset_overrides`` and ``_load_categories`` are built on this,
+    and parsing is memoized by ``_load_json_file``.  The returned objects
+    are shared with that cache and must not be mutated.
+    """
+    base_dir = _app_base_dir()
+    base: dict[str, str] | None = None
+    categories: dict[str, list[dict]] = {}
     for fname in UNIFIED_FILES:
+        if base is not None and categories:
+            break
         upath = base_dir / fname
         if not upath.is_file():
             continue
         try:
-            with open(upath, "r", encoding="utf-8") as f:
-                udata = _json.load(f)
-            categories: dict[str, list[dict]] = {}
-            if isinstance(udata, dict):
-                for key, value in udata.items():
-                    if key.lower() == "base":
-                        continue
-                    if isinstance(value, list) and all(isinstance(x, dict) for x in value):
-                        categories[key] = value
-            if categories:
-                return categories
+            udata = _load_json_file(upath)
         except Exception:
-            pass
-    return {}
-
+            continue
+        if not isinstance(udata, dict):
+            continue
+        if base is None and isinstance(udata.get("Base"), dict):
+            base = udata["Base"]
+        if not categories:
+            for key, value in udata.items():
+                if key.lower() == "base":
+                    continue
+                if isinstance(value, list) and all(isinstance(x, dict) for x in value):
+                    categories[key] = value
+    return base, categories
 
 
 def _load_offset_overrides() -> dict[str, str] | None:
@@ -878,70 +1600,43 @@ def _load_offset_overrides() -> dict[str, str] | None:
     The returned dictionary contains mappings such as ``"Player Base Address"``
     which override the default constants in this module.
     """
-    base_dir = _app_base_dir()
+    return _load_unified()[0]
 
-    # Try unified files
-    for fname in UNIFIED_FILES:
-        upath = base_dir / fname
-        if not upath.is_file():
-            continue
-        try:
-            with open(upath, "r", encoding="utf-8") as f:
-                udata = _json.load(f)
-            if isinstance(udata, dict):
-                base = udata.get("Base")
-                if isinstance(base, dict):
-                    return base
-        except Exception:
-            continue
-    return None
+
+# Apply overrides if present.  Each entry maps a key of the ``Base`` section
+# to the module constant it replaces; values are hex strings.  Missing keys
+# keep the built‑in default and unparsable values are ignored.
+_OFFSET_OVERRIDES: tuple[tuple[str, str], ...] = (
+    ("Player Base Address", "PLAYER_TABLE_RVA"),
+    ("Player Offset Length", "PLAYER_STRIDE"),
+    # Name offsets
+    ("Offset First Name", "OFF_FIRST_NAME"),
+    ("Offset Last Name", "OFF_LAST_NAME"),
+    ("Offset Face ID", "OFF_FACE_ID"),
+    ("Offset Player Team", "OFF_TEAM_PTR"),
+    ("Offset Player Team Name", "OFF_TEAM_NAME"),
+)
+
+
+def _hex_override(offsets: dict, key: str, current: int) -> int:
+    """Return ``offsets[key]`` parsed as hex, or ``current`` if unusable."""
+    value = offsets.get(key)
+    if not isinstance(value, str):
+        return current
+    try:
+        return int(value, 16)
+    except ValueError:
+        return current
 
 
-# Apply overrides if present
 _offsets = _load_offset_overrides()
 if _offsets:
-    try:
-        PLAYER_TABLE_RVA = int(
-            _offsets.get("Player Base Address", hex(PLAYER_TABLE_RVA)), 16
-        )
-    except Exception:
-        pass
-    try:
-        PLAYER_STRIDE = int(
-            _offsets.get("Player Offset Length", hex(PLAYER_STRIDE)), 16
-        )
-    except Exception:
-        pass
-    # Name offsets
-    try:
-        OFF_FIRST_NAME = int(_offsets.get("Offset First Name", hex(OFF_FIRST_NAME)), 16)
-    except Exception:
-        pass
-    try:
-        OFF_LAST_NAME = int(_offsets.get("Offset Last Name", hex(OFF_LAST_NAME)), 16)
-    except Exception:
-        pass
-    try:
-        OFF_FACE_ID = int(_offsets.get("Offset Face ID", hex(OFF_FACE_ID)), 16)
-    except Exception:
-        pass
-    try:
-        OFF_TEAM_PTR = int(_offsets.get("Offset Player Team", hex(OFF_TEAM_PTR)), 16)
-    except Exception:
-        pass
-    try:
-        OFF_TEAM_NAME = int(
-            _offsets.get("Offset Player Team Name", hex(OFF_TEAM_NAME)), 16
-        )
-    except Exception:
-        pass
+    for _key, _const in _OFFSET_OVERRIDES:
+        globals()[_const] = _hex_override(_offsets, _key, globals()[_const])
     # Adjust name length if provided (convert bytes to UTF‑16 characters)
-    try:
-        name_bytes = int(_offsets.get("Name Field Length", "0"), 16)
-        if name_bytes > 0:
-            NAME_MAX_CHARS = max(1, name_bytes // 2)
-    except Exception:
-        pass
+    name_bytes = _hex_override(_offsets, "Name Field Length", 0)
+    if name_bytes > 0:
+        NAME_MAX_CHARS = max(1, name_bytes // 2)
 
 ###############################################################################
 # Windows API declarations
@@ -969,8 +1664,11 @@ if sys.platform == "win32":
     TH32CS_SNAPPROCESS = 0x00000002
     TH32CS_SNAPMODULE = 0x00000008
     TH32CS_SNAPMODULE32 = 0x00000010
+    LIST_MODULES_ALL = 0x03
+    STILL_ACTIVE = 259
 
     kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    psapi = ctypes.WinDLL("psapi", use_last_error=True)
 
     # ---------------------------------------------------------------------
     # Handle potential API changes in ctypes.wintypes
@@ -1065,6 +1763,140 @@ if sys.platform == "win32":
     ]
     WriteProcessMemory.restype = wintypes.BOOL
 
+    # psapi enumeration: process IDs and module handles are returned as
+    # flat arrays, so no per‑entry structure or snapshot object is needed.
+    EnumProcesses = psapi.EnumProcesses
+    EnumProcesses.argtypes = [
+        ctypes.POINTER(wintypes.DWORD),
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    EnumProcesses.restype = wintypes.BOOL
+
+    EnumProcessModulesEx = psapi.EnumProcessModulesEx
+    EnumProcessModulesEx.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.HMODULE),
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+        wintypes.DWORD,
+    ]
+    EnumProcessModulesEx.restype = wintypes.BOOL
+
+    GetModuleBaseNameW = psapi.GetModuleBaseNameW
+    GetModuleBaseNameW.argtypes = [
+        wintypes.HANDLE,
+        wintypes.HMODULE,
+        wintypes.LPWSTR,
+        wintypes.DWORD,
+    ]
+    GetModuleBaseNameW.restype = wintypes.DWORD
+
+    QueryFullProcessImageNameW = kernel32.QueryFullProcessImageNameW
+    QueryFullProcessImageNameW.argtypes = [
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    QueryFullProcessImageNameW.restype = wintypes.BOOL
+
+    GetExitCodeProcess = kernel32.GetExitCodeProcess
+    GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    GetExitCodeProcess.restype = wintypes.BOOL
+
+
+# Bound UTF‑16LE decoder.  ``str(raw, "utf-16le", ...)`` looks the codec up
+# by name on every call, which costs several times the decoding itself for
+# strings as short as player names.
+_UTF16LE_DECODE = codecs.getdecoder("utf-16-le")
+
+
+def _decode_wstring(buf, start: int, max_chars: int) -> str:
+    """Decode a NUL‑terminated UTF‑16LE string from ``buf`` at ``start``.
+
+    ``buf`` may be ``bytes``, a ``bytearray`` or a ``memoryview``; at most
+    ``max_chars`` characters are decoded.  Undecodable code units are
+    dropped, matching the behaviour of ``GameMemory.read_wstring``.
+    """
+    raw = buf[start : start + max_chars * 2]
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    # Names are usually much shorter than their field, so find the NUL
+    # terminator (a zero code unit, i.e. at an even position) in the raw
+    # bytes and decode only what precedes it.  Unused slots of the player
+    # table start with the terminator and decode nothing at all.
+    end = raw.find(b"\x00\x00")
+    while end != -1 and end % 2:
+        end = raw.find(b"\x00\x00", end + 1)
+    if end != -1:
+        raw = raw[:end]
+    return _UTF16LE_DECODE(raw, "ignore")[0]
+
+
+def _build_player_record_unpacker():
+    """Return ``(unpack, iter_records)`` for the fixed fields of player records.
+
+    ``unpack(buf, rec)`` returns ``(last_name_raw, first_name_raw, face_id,
+    team_ptr)`` for the record starting at ``rec``, where the names are the
+    raw UTF‑16LE bytes of their fields.  ``iter_records(buf, count)`` yields
+    the same tuples for ``count`` consecutive records starting at ``buf[0]``.
+
+    The fields are read with a single precompiled ``struct.Struct`` whose
+    format pads the gaps between them, so a record costs one ``unpack_from``
+    call; ``iter_records`` pads that format to the full stride and walks the
+    table with ``iter_unpack``, which keeps the per‑record loop in C.  The
+    layout comes from the (possibly overridden) offsets, so if overrides make
+    the fields overlap or run past the record, each field is unpacked on its
+    own instead.
+    """
+    name_fmt = f"{NAME_MAX_CHARS * 2}s"
+    fields = [
+        (OFF_LAST_NAME, name_fmt),
+        (OFF_FIRST_NAME, name_fmt),
+        (OFF_FACE_ID, "I"),
+        (OFF_TEAM_PTR, "Q"),
+    ]
+    order = sorted(range(len(fields)), key=lambda k: fields[k][0])
+    fmt = "<"
+    pos = 0
+    for k in order:
+        off, code = fields[k]
+        if off < pos:
+            break
+        if off > pos:
+            fmt += f"{off - pos}x"
+        fmt += code
+        pos = off + struct.calcsize("<" + code)
+    else:
+        if pos <= PLAYER_STRIDE:
+            record = struct.Struct(fmt)
+            # Struct results come out in offset order; put them back in the
+            # order documented above.
+            reorder = operator.itemgetter(*(order.index(k) for k in range(len(fields))))
+
+            table = struct.Struct(fmt + f"{PLAYER_STRIDE - pos}x")
+
+            def unpack(buf, rec: int) -> tuple:
+                return reorder(record.unpack_from(buf, rec))
+
+            def iter_records(buf, count: int):
+                return map(reorder, table.iter_unpack(buf[: count * PLAYER_STRIDE]))
+
+            return unpack, iter_records
+    singles = [(off, struct.Struct("<" + code)) for off, code in fields]
+
+    def unpack_each(buf, rec: int) -> tuple:
+        return tuple(st.unpack_from(buf, rec + off)[0] for off, st in singles)
+
+    def iter_each(buf, count: int):
+        return (unpack_each(buf, i * PLAYER_STRIDE) for i in range(count))
+
+    return unpack_each, iter_each
+
+
+_unpack_player_record, _iter_player_records = _build_player_record_unpacker()
+
 
 class GameMemory:
     """Utility class encapsulating process lookup and memory access."""
@@ -1074,27 +1906,46 @@ class GameMemory:
         self.pid: int | None = None
         self.hproc: wintypes.HANDLE | None = None
         self.base_addr: int | None = None
+        # Staging buffer for WriteProcessMemory.  It is grown on demand and
+        # reused so that each write only memmoves the payload instead of
+        # building a new ctypes array type and instance.  The lock keeps
+        # writes issued from worker threads from sharing it concurrently.
+        self._write_buf: ctypes.Array | None = None
+        self._write_count = ctypes.c_size_t()
+        self._write_lock = threading.Lock()
+        # Scratch buffer and byte counter for ``read_bytes``.  Reads up to a
+        # player record in size (nearly all of them) land here instead of in
+        # a freshly allocated array; larger reads allocate their own.  Scans
+        # run on worker threads, hence the lock.
+        self._read_buf = ctypes.create_string_buffer(PLAYER_STRIDE)
+        self._read_count = ctypes.c_size_t()
+        self._read_lock = threading.Lock()
 
     # -------------------------------------------------------------------------
     # Process management
     # -------------------------------------------------------------------------
     def find_pid(self) -> int | None:
         """Return the PID of the target process, or None if not found."""
-        # Use psutil when available for convenience
-        try:
-            import psutil  # type: ignore
-
-            for proc in psutil.process_iter(["name"]):
-                if (
-                    proc.info["name"]
-                    and proc.info["name"].lower() == self.module_name.lower()
-                ):
-                    return proc.pid
-        except Exception:
-            pass
-        # Fallback to toolhelp snapshot on Windows
+        # Lower‑case the target once rather than for every process visited
+        target = self.module_name.lower()
         if sys.platform != "win32":
+            # psutil is only consulted off Windows; importing it and building
+            # a ``Process`` object per entry is much slower than psapi.
+            try:
+                import psutil  # type: ignore
+
+                for proc in psutil.process_iter(["name"]):
+                    name = proc.info["name"]
+                    if name and name.lower() == target:
+                        return proc.pid
+            except Exception:
+                pass
             return None
+        try:
+            return self._find_pid_psapi(target)
+        except OSError:
+            pass
+        # Fallback to toolhelp snapshot if psapi enumeration failed
         snap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
         if not snap:
             return None
@@ -1103,13 +1954,51 @@ class GameMemory:
         try:
             success = Process32FirstW(snap, ctypes.byref(entry))
             while success:
-                if entry.szExeFile.lower() == self.module_name.lower():
+                if entry.szExeFile.lower() == target:
                     return entry.th32ProcessID
                 success = Process32NextW(snap, ctypes.byref(entry))
         finally:
             CloseHandle(snap)
         return None
 
+    @staticmethod
+    def _find_pid_psapi(target: str) -> int | None:
+        """Find the PID whose image base name equals ``target`` (lower case).
+
+        Uses ``EnumProcesses`` to fetch every PID into one ``DWORD`` array and
+        ``QueryFullProcessImageNameW`` to get each image path, which needs
+        only ``PROCESS_QUERY_LIMITED_INFORMATION``.  Processes that cannot be
+        opened (system or protected ones) are skipped.  Raises ``OSError``
+        if the process list itself cannot be retrieved.
+        """
+        count = 1024
+        while True:
+            pids = (wintypes.DWORD * count)()
+            needed = wintypes.DWORD()
+            if not EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+                raise ctypes.WinError(ctypes.get_last_error())
+            # A full array may mean the list was truncated; retry larger
+            if needed.value < ctypes.sizeof(pids):
+                break
+            count *= 2
+        path = ctypes.create_unicode_buffer(32768)
+        size = wintypes.DWORD()
+        for pid in pids[: needed.value // ctypes.sizeof(wintypes.DWORD)]:
+            if not pid:
+                continue
+            handle = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                continue
+            try:
+                size.value = len(path)
+                if not QueryFullProcessImageNameW(handle, 0, path, ctypes.byref(size)):
+                    continue
+            finally:
+                CloseHandle(handle)
+            if os.path.basename(path.value).lower() == target:
+                return pid
+        return None
+
     def open_process(self) -> bool:
         """Open the game process and resolve its base address.
 
@@ -1148,6 +2037,24 @@ class GameMemory:
         self.base_addr = base
         return True
 
+    def ensure_open(self) -> bool:
+        """Return ``True`` if a usable process handle is open, opening one if not.
+
+        ``open_process`` enumerates every running process to find the game
+        before it can reuse its handle, which is far too slow to do for each
+        field access.  This keeps the open handle as long as the process it
+        refers to is still running (one ``GetExitCodeProcess`` call) and only
+        falls back to ``open_process`` when there is no handle or the game
+        has exited.
+        """
+        if self.hproc and self.base_addr is not None:
+            if sys.platform != "win32":
+                return True
+            code = wintypes.DWORD()
+            if GetExitCodeProcess(self.hproc, ctypes.byref(code)) and code.value == STILL_ACTIVE:
+                return True
+        return self.open_process()
+
     def close(self) -> None:
         """Close any open process handle and reset state."""
         if self.hproc:
@@ -1163,7 +2070,11 @@ class GameMemory:
         """Return the base address of ``module_name`` in the given process."""
         if sys.platform != "win32":
             return None
-        # Take a snapshot of modules
+        target = module_name.lower()
+        base = self._get_module_base_psapi(pid, target)
+        if base is not None:
+            return base
+        # Fall back to a snapshot of modules
         flags = TH32CS_SNAPMODULE | TH32CS_SNAPMODULE32
         snap = CreateToolhelp32Snapshot(flags, pid)
         if not snap:
@@ -1174,7 +2085,7 @@ class GameMemory:
             if not Module32FirstW(snap, ctypes.byref(me32)):
                 return None
             while True:
-                if me32.szModule.lower() == module_name.lower():
+                if me32.szModule.lower() == target:
                     return ctypes.cast(me32.modBaseAddr, ctypes.c_void_p).value
                 if not Module32NextW(snap, ctypes.byref(me32)):
                     break
@@ -1182,60 +2093,226 @@ class GameMemory:
             CloseHandle(snap)
         return None
 
-    # -------------------------------------------------------------------------
-    # Memory access helpers
-    # -------------------------------------------------------------------------
-    def _check_open(self):
-        if self.hproc is None or self.base_addr is None:
-            raise RuntimeError("Game process not opened")
+    @staticmethod
+    def _get_module_base_psapi(pid: int, target: str) -> int | None:
+        """Return the base of module ``target`` (lower case) via psapi, or None.
 
-    def read_bytes(self, addr: int, length: int) -> bytes:
+        ``EnumProcessModulesEx`` returns all module handles in one array; a
+        module handle is its load address, so only the base names need to
+        be queried.  The game executable is normally the first module.
+        """
+        handle = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid)
+        if not handle:
+            return None
+        try:
+            count = 1024
+            while True:
+                mods = (wintypes.HMODULE * count)()
+                needed = wintypes.DWORD()
+                if not EnumProcessModulesEx(
+                    handle, mods, ctypes.sizeof(mods), ctypes.byref(needed), LIST_MODULES_ALL
+                ):
+                    return None
+                if needed.value <= ctypes.sizeof(mods):
+                    break
+                count = needed.value // ctypes.sizeof(wintypes.HMODULE)
+            name = ctypes.create_unicode_buffer(260)
+            for mod in mods[: needed.value // ctypes.sizeof(wintypes.HMODULE)]:
+                if not mod:
+                    continue
+                if GetModuleBaseNameW(handle, mod, name, len(name)) and name.value.lower() == target:
+                    return mod
+        finally:
+            CloseHandle(handle)
+        return None
+
+    # -------------------------------------------------------------------------
+    # Memory access helpers
+    # -------------------------------------------------------------------------
+    def _check_open(self):
+        if self.hproc is None or self.base_addr is None:
+            raise RuntimeError("Game process not opened")
+
+    def read_bytes(self, addr: int, length: int) -> bytes:
         """Read ``length`` bytes from absolute address ``addr``."""
         self._check_open()
-        buf = (ctypes.c_ubyte * length)()
+        if length <= len(self._read_buf):
+            with self._read_lock:
+                buf = self._read_buf
+                read_count = self._read_count
+                ok = ReadProcessMemory(
+                    self.hproc,
+                    ctypes.c_void_p(addr),
+                    buf,
+                    length,
+                    ctypes.byref(read_count),
+                )
+                if not ok or read_count.value != length:
+                    raise RuntimeError(f"Failed to read memory at 0x{addr:X}")
+                # Copy out exactly ``length`` bytes while the buffer is ours
+                return ctypes.string_at(buf, length)
+        # A ``c_char`` array exposes its contents as ``.raw`` with a single
+        # copy; ``bytes()`` of a ``c_ubyte`` array converts element by element.
+        buf = (ctypes.c_char * length)()
         read_count = ctypes.c_size_t()
         ok = ReadProcessMemory(
             self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(read_count)
         )
         if not ok or read_count.value != length:
             raise RuntimeError(f"Failed to read memory at 0x{addr:X}")
-        return bytes(buf)
+        return buf.raw
 
     def write_bytes(self, addr: int, data: bytes) -> None:
-        """Write ``data`` to absolute address ``addr``."""
+        """Write ``data`` to absolute address ``addr``.
+
+        ``data`` may be ``bytes`` or a writable byte buffer (a ``bytearray``
+        or a ``memoryview`` slice of one); the latter is copied into the
+        staging buffer directly instead of first being converted to
+        ``bytes``.
+        """
+        self._check_open()
+        if isinstance(data, bytes):
+            length = len(data)
+            src = data
+        else:
+            try:
+                view = memoryview(data).cast("B")
+                length = len(view)
+                src = (ctypes.c_char * length).from_buffer(view)
+            except (TypeError, ValueError):
+                src = bytes(data)
+                length = len(src)
+        with self._write_lock:
+            buf = self._write_buf
+            if buf is None or len(buf) < length:
+                buf = self._write_buf = (ctypes.c_ubyte * max(length, PLAYER_STRIDE))()
+            ctypes.memmove(buf, src, length)
+            written = self._write_count
+            ok = WriteProcessMemory(
+                self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(written)
+            )
+            if not ok or written.value != length:
+                raise RuntimeError(f"Failed to write memory at 0x{addr:X}")
+
+    def read_struct(self, addr: int, cls):
+        """Read an instance of the ctypes type ``cls`` from ``addr``.
+
+        ``cls`` may be a scalar such as ``c_uint32``, an array type or a
+        ``ctypes.Structure`` subclass; ``sizeof(cls)`` bytes are read with a
+        single ReadProcessMemory call straight into a new instance, with no
+        intermediate ``bytes`` object to unpack.  (x86 is little endian, so
+        the native ctypes layout matches the game's.)
+        """
+        self._check_open()
+        value = cls()
+        size = ctypes.sizeof(value)
+        read_count = ctypes.c_size_t()
+        ok = ReadProcessMemory(
+            self.hproc,
+            ctypes.c_void_p(addr),
+            ctypes.byref(value),
+            size,
+            ctypes.byref(read_count),
+        )
+        if not ok or read_count.value != size:
+            raise RuntimeError(f"Failed to read memory at 0x{addr:X}")
+        return value
+
+    def read_uint32(self, addr: int) -> int:
+        return self.read_struct(addr, ctypes.c_uint32).value
+
+    def read_uint(self, addr: int, size: int) -> int:
+        """Read a little‑endian unsigned integer of ``size`` (1–8) bytes.
+
+        The bytes land directly in the low end of a zeroed ``c_uint64``, so
+        a bit field spanning up to eight bytes is read with no ``bytes``
+        object or ``int.from_bytes`` call; only ``size`` bytes are read, so
+        nothing past the field is touched.
+        """
+        self._check_open()
+        if not 0 < size <= 8:
+            raise ValueError(f"read_uint size must be 1..8, got {size}")
+        value = ctypes.c_uint64()
+        read_count = ctypes.c_size_t()
+        ok = ReadProcessMemory(
+            self.hproc,
+            ctypes.c_void_p(addr),
+            ctypes.byref(value),
+            size,
+            ctypes.byref(read_count),
+        )
+        if not ok or read_count.value != size:
+            raise RuntimeError(f"Failed to read memory at 0x{addr:X}")
+        return value.value
+
+    def write_uint(self, addr: int, value: int, size: int) -> None:
+        """Write the low ``size`` (1–8) bytes of ``value`` little‑endian.
+
+        The counterpart of ``read_uint``: the value is stored in a
+        ``c_uint64`` whose low bytes are written straight from that object,
+        so no ``bytes`` object is built and nothing is staged through the
+        shared write buffer.  Bits of ``value`` above ``size`` bytes are
+        ignored.
+        """
         self._check_open()
-        length = len(data)
-        buf = (ctypes.c_ubyte * length).from_buffer_copy(data)
+        if not 0 < size <= 8:
+            raise ValueError(f"write_uint size must be 1..8, got {size}")
+        word = ctypes.c_uint64(value & 0xFFFFFFFFFFFFFFFF)
         written = ctypes.c_size_t()
         ok = WriteProcessMemory(
-            self.hproc, ctypes.c_void_p(addr), buf, length, ctypes.byref(written)
+            self.hproc, ctypes.c_void_p(addr), ctypes.byref(word), size, ctypes.byref(written)
         )
-        if not ok or written.value != length:
+        if not ok or written.value != size:
             raise RuntimeError(f"Failed to write memory at 0x{addr:X}")
 
-    def read_uint32(self, addr: int) -> int:
-        data = self.read_bytes(addr, 4)
-        return struct.unpack("<I", data)[0]
-
     def write_uint32(self, addr: int, value: int) -> None:
         data = struct.pack("<I", value & 0xFFFFFFFF)
         self.write_bytes(addr, data)
 
     def read_uint64(self, addr: int) -> int:
-        data = self.read_bytes(addr, 8)
-        return struct.unpack("<Q", data)[0]
+        return self.read_struct(addr, ctypes.c_uint64).value
+
+    def read_block(self, addr: int, buf) -> None:
+        """Fill the writable buffer ``buf`` with ``len(buf)`` bytes from ``addr``.
+
+        Large tables (e.g. the player array) are read with a single
+        ReadProcessMemory call straight into a caller‑owned ``bytearray``
+        (or a writable ``memoryview`` slice of one).  ``c_char.from_buffer``
+        exposes the existing storage to ctypes, so no ctypes array type is
+        built and no intermediate copy is made; callers can keep one buffer
+        alive and reuse it across scans.  Raises ``RuntimeError`` if the
+        full range could not be read.
+        """
+        self._check_open()
+        length = len(buf)
+        if length <= 0:
+            return
+        read_count = ctypes.c_size_t()
+        ok = ReadProcessMemory(
+            self.hproc,
+            ctypes.c_void_p(addr),
+            ctypes.byref(ctypes.c_char.from_buffer(buf)),
+            length,
+            ctypes.byref(read_count),
+        )
+        if not ok or read_count.value != length:
+            raise RuntimeError(f"Failed to read memory at 0x{addr:X}")
+
+    def read_player_record(self, player_addr: int) -> memoryview:
+        """Read the whole player record at ``player_addr`` in one call.
+
+        Returns a ``memoryview`` of ``PLAYER_STRIDE`` bytes; fields are then
+        sliced out locally (e.g. with ``_unpack_player_record(rec, 0)``)
+        instead of issuing one ReadProcessMemory per field.
+        """
+        buf = bytearray(PLAYER_STRIDE)
+        self.read_block(player_addr, buf)
+        return memoryview(buf)
 
     def read_wstring(self, addr: int, max_chars: int) -> str:
         """Read a UTF‑16LE string of at most ``max_chars`` characters from ``addr``."""
         raw = self.read_bytes(addr, max_chars * 2)
-        try:
-            s = raw.decode("utf-16le", errors="ignore")
-        except Exception:
-            return ""
-        end = s.find("\x00")
-        if end != -1:
-            s = s[:end]
-        return s
+        return _decode_wstring(raw, 0, max_chars)
 
     def write_wstring_fixed(self, addr: int, value: str, max_chars: int) -> None:
         """Write a fixed length null‑terminated UTF‑16LE string at ``addr``."""
@@ -1246,14 +2323,29 @@ class GameMemory:
 class Player:
     """Container class representing basic player data."""
 
+    # A full scan creates one instance per populated record (thousands of
+    # them), so the fields are stored in slots rather than a per‑instance
+    # ``__dict__``.  This keeps the cached player list several times smaller
+    # and makes attribute access slightly faster.
+    __slots__ = ("index", "first_name", "last_name", "team", "face_id", "team_ptr")
+
     def __init__(
-        self, index: int, first_name: str, last_name: str, team: str, face_id: int
+        self,
+        index: int,
+        first_name: str,
+        last_name: str,
+        team: str,
+        face_id: int,
+        team_ptr: int = 0,
     ):
         self.index = index
         self.first_name = first_name
         self.last_name = last_name
         self.team = team
         self.face_id = face_id
+        # Raw team pointer read during the scan (0 when unknown or a free
+        # agent); kept so team labels can be rebuilt without re-reading it.
+        self.team_ptr = team_ptr
 
     @property
     def full_name(self) -> str:
@@ -1267,6 +2359,10 @@ class Player:
 class PlayerDataModel:
     """High level API for scanning and editing NBA 2K25 player records."""
 
+    # Seconds for which a finished ``refresh_players`` scan is considered
+    # current by ``refresh_players_if_stale``.
+    REFRESH_TTL: Final = 2.0
+
     def __init__(self, mem: GameMemory, max_players: int = MAX_PLAYERS):
         self.mem = mem
         self.max_players = max_players
@@ -1280,6 +2376,15 @@ class PlayerDataModel:
         # Current list of available teams represented as (index, name) tuples.
         # This will be populated by scanning memory.
         self.team_list: list[tuple[int, str]] = []
+        # Display name -> team index for ``team_list`` (first index wins),
+        # kept in step by ``_set_team_list``.
+        self._team_name_to_idx: Dict[str, int] = {}
+        # Display group of each ``team_list`` entry (see
+        # ``_recompute_team_categories``).
+        self._team_categories: list[int] = []
+        # Players grouped by their ``team`` label, rebuilt together with
+        # ``name_index_map`` so fallback team filtering is a dict lookup.
+        self._players_by_team: Dict[str, list[Player]] = {}
         # Mapping of team index to roster type (0 = NBA, 1 = Historic, etc.).
         self.team_types: Dict[int, int] = {}
 
@@ -1288,52 +2393,100 @@ class PlayerDataModel:
         # ``get_players_by_team`` will filter ``self.players`` by team name
         # instead of using roster pointers.
         self.fallback_players: bool = False
+        # ``time.monotonic()`` when ``refresh_players`` last completed, or
+        # ``None`` if the player and team lists have not been read since the
+        # last write that can change them (names, teams, copied players).
+        self._refreshed_at: float | None = None
 
         # Internal caches for resolved pointer chains.  During a successful
         # scan, these fields store the computed base address of the player
         # table, the team records and the stadium records.  Subsequent
         # operations use the cached values to avoid repeatedly resolving
-        # pointers.  They are reset whenever ``refresh_players`` is called.
+        # pointers.  They are reset whenever ``refresh_players`` is called,
+        # and whenever the game process they were resolved in changes (see
+        # ``_sync_resolver_cache``).
         self._resolved_player_base: int | None = None
         self._resolved_team_base: int | None = None
+        # ``(pid, handle, module base)`` the cached pointers belong to.
+        self._resolver_key: tuple | None = None
+        # Root pointers of the player/team chains keyed by RVA (``None`` if
+        # unreadable), shared by both resolvers until one of them fails.
+        self._chain_root_values: Dict[int, int | None] | None = None
+        # Scratch buffer receiving the raw player table during a full scan.
+        # It is allocated on first use and reused by later scans so that a
+        # rescan does not allocate several megabytes each time.
+        self._player_block: bytearray | None = None
+        # Same for the team table read by ``_scan_team_names``.
+        self._team_block: bytearray | None = None
+        # Scratch buffer for the source bytes of ``copy_player_data``.
+        self._copy_buf: bytearray | None = None
+        # Display names composed from raw team pointers during the current
+        # scan.  Thousands of players point at a few hundred teams, so each
+        # team record is only read once per refresh.
+        self._team_name_by_ptr: Dict[int, str] = {}
+        # Fingerprint of the raw player table from the last scan and the
+        # records decoded from it.  When the game has not touched the table
+        # since (the common case when the player list is simply reopened)
+        # the name decoding is skipped and only team names are recomposed.
+        self._scan_fingerprint: tuple | None = None
+        self._scan_records: list[tuple[int, str, str, int, int]] = []
 
         # List of stadiums discovered in memory.  Each element is
         # (index, arena_name).  Populated via ``_scan_stadium_names``.
 
-        # Load category definitions for advanced editing.  These definitions
-        # describe where and how to read/write additional player attributes
-        # (e.g. vitals, attributes, tendencies, badges).  They come from
-        # unified offsets files if present.  If no unified file is found
-        # ``categories`` will be empty and the full editor will display
-        # placeholder text.
+        # Category definitions for advanced editing are loaded on first
+        # access of ``self.categories``; see the property below.
+
+    @functools.cached_property
+    def categories(self) -> dict[str, list[dict]]:
+        """Category definitions for the full editor, loaded on first use.
+
+        These definitions describe where and how to read/write additional
+        player attributes (e.g. vitals, attributes, tendencies, badges).
+        They come from the offsets files if present; if none is found only
+        ``EXTRA_CATEGORIES`` are available and the full editor will display
+        placeholder text for the rest.  Loading, merging and reordering
+        happen the first time the property is read (typically when an
+        editor or import window opens) rather than while the main window
+        starts up.  The result is cached on the instance, so callers may
+        mutate it as before.
+        """
         try:
-            self.categories: dict[str, list[dict]] = _load_categories()
+            categories: dict[str, list[dict]] = _load_categories()
         except Exception:
-            self.categories = {}
+            categories = {}
         # Merge in any extra categories defined by the editor.  If a category
         # already exists, append only new fields.  Otherwise add the
-        # category wholesale.  See EXTRA_CATEGORIES for definitions.
+        # category wholesale.  See EXTRA_CATEGORIES for definitions.  The
+        # set of seen names is built once per category and updated as
+        # fields are appended, so duplicate names within the extras are
+        # also skipped.
         for extra_cat, fields in EXTRA_CATEGORIES.items():
-            if extra_cat in self.categories:
-                existing = {f.get("name") for f in self.categories[extra_cat]}
-                for f in fields:
-                    if f.get("name") not in existing:
-                        self.categories[extra_cat].append(f)
-            else:
+            current = categories.get(extra_cat)
+            if current is None:
                 # Use a shallow copy to avoid modifying the global list
-                self.categories[extra_cat] = list(fields)
+                categories[extra_cat] = list(fields)
+                continue
+            seen = {f.get("name") for f in current}
+            for f in fields:
+                name = f.get("name")
+                if name not in seen:
+                    seen.add(name)
+                    current.append(f)
         # Reorder categories based on import header order and extract
         # durability fields into a separate category.  This ensures the
         # editor displays fields in a predictable order matching the
         # provided sample tables and that durability fields are grouped
-        # together.  Reordering is done immediately after loading so
-        # subsequent operations (e.g. import) use the reordered lists.
-        self._reorder_categories()
+        # together.  Reordering is done right after loading so subsequent
+        # operations (e.g. import) use the reordered lists.
+        return self._reorder_categories(categories)
 
     # -------------------------------------------------------------------------
     # Category reordering and import helpers
     # -------------------------------------------------------------------------
-    def _normalize_header_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_header_name(name: str) -> str:
         """
         Normalize a column header name for matching against field names.
 
@@ -1348,217 +2501,34 @@ class PlayerDataModel:
 
         Returns:
             A canonical string used for matching against field names.
-        """
-        import re as _re
 
-        norm = _re.sub(r"[^A-Za-z0-9]", "", str(name).upper())
-        # Apply known header synonyms; map abbreviations to canonical
-        # attribute names.  Only a subset of synonyms is defined here; any
-        # unknown name will fall back to its normalized form.
-        header_synonyms = {
-            "LAYUP": "DRIVINGLAYUP",
-            "STDUNK": "STANDINGDUNK",
-            "DUNK": "DRIVINGDUNK",
-            "CLOSE": "CLOSESHOT",
-            "MID": "MIDRANGESHOT",
-            "3PT": "3PTSHOT",
-            "FT": "FREETHROW",
-            "PHOOK": "POSTHOOK",
-            "PFADE": "POSTFADE",
-            "POSTC": "POSTMOVES",
-            "FOUL": "DRAWFOUL",
-            "BALL": "BALLCONTROL",
-            "SPDBALL": "SPEEDWITHBALL",
-            "SPDBALL": "SPEEDWITHBALL",
-            "PASSIQ": "PASSINGIQ",
-            "PASS_IQ": "PASSINGIQ",
-            "VISION": "PASSINGVISION",
-            "OCNST": "OFFENSIVECONSISTENCY",
-            "ID": "INTERIORDEFENSE",
-            "PD": "PERIMETERDEFENSE",
-            "STEAL": "STEAL",
-            "BLOCK": "BLOCK",
-            "OREB": "OFFENSIVEREBOUND",
-            "DREB": "DEFENSIVEREBOUND",
-            "HELPIQ": "HELPDEFENSEIQ",
-            "PSPER": "PASSINGPERCEPTION",
-            "DCNST": "DEFENSIVECONSISTENCY",
-            "SPEED": "SPEED",
-            "AGIL": "AGILITY",
-            "STR": "STRENGTH",
-            "VERT": "VERTICAL",
-            "STAM": "STAMINA",
-            "INTNGBL": "INTANGIBLES",
-            "HSTL": "HUSTLE",
-            "DUR": "MISCELLANEOUSDURABILITY",
-            "POT": "POTENTIAL",
-            # Durability synonyms
-            "BACK": "BACKDURABILITY",
-            "HEAD": "HEADDURABILITY",
-            "LEFTANKLE": "LEFTANKLEDURABILITY",
-            "LEFTELBOW": "LEFTELBOWDURABILITY",
-            "LEFTFOOT": "LEFTFOOTDURABILITY",
-            "LEFTHIP": "LEFTHIPDURABILITY",
-            "LEFTKNEE": "LEFTKNEEDURABILITY",
-            "LEFTSHOULDER": "LEFTSHOULDERDURABILITY",
-            "NECK": "NECKDURABILITY",
-            "RIGHTANKLE": "RIGHTANKLEDURABILITY",
-            "RIGHTELBOW": "RIGHTELBOWDURABILITY",
-            "RIGHTFOOT": "RIGHTFOOTDURABILITY",
-            "RIGHTHIP": "RIGHTHIPDURABILITY",
-            "RIGHTKNEE": "RIGHTKNEEDURABILITY",
-            "RIGHTSHOULDER": "RIGHTSHOULDERDURABILITY",
-            "MISCELLANEOUS": "MISCELLANEOUSDURABILITY",
-            "MISCELLANEOUSDURABILITY": "MISCELLANEOUSDURABILITY",
-            # Tendencies abbreviations (T/ prefixed) mapped to canonical field names.
-            # These mappings allow the importer to align columns from the
-            # Tendencies spreadsheet with the corresponding field names in
-            # the offset map.  Each key is the normalized abbreviation (no
-            # punctuation); the value is the normalized field name
-            # (uppercase, no spaces) used in the offset map.  This list
-            # covers all abbreviations that appear in the user's sheet.
-            # Abbreviation mappings for shooting/finishing
-            "TSHOT": "SHOOT",  # generic Shot -> Shoot (from user: shot = shoot)
-            "TTOUCH": "TOUCHES",
-            "TSCLOSE": "SHOTCLOSE",
-            "TSUNDER": "SHOTUNDERBASKET",
-            "TSCL": "SHOTCLOSELEFT",
-            "TSCM": "SHOTCLOSEMIDDLE",
-            "TSCR": "SHOTCLOSERIGHT",
-            "TSMID": "SHOTMID",
-            "TSUSMID": "SPOTUPSHOTMID",
-            "TOSSMID": "OFFSCREENSHOTMID",
-            "TSML": "SHOTMIDLEFT",
-            "TSMLC": "SHOTMIDLEFTCENTER",
-            "TSMC": "SHOTMIDCENTER",
-            "TSMRC": "SHOTMIDRIGHTCENTER",
-            "TSMR": "SHOTMIDRIGHT",
-            "TS3PT": "SHOT3PT",
-            "TSUS3PT": "SPOTUPSHOT3PT",
-            "TOSS3PT": "OFFSCREENSHOT3PT",
-            "TS3L": "SHOT3PTLEFT",
-            "TS3LC": "SHOT3PTLEFTCENTER",
-            "TS3C": "SHOT3PTCENTER",
-            "TS3RC": "SHOT3PTRIGHTCENTER",
-            "TS3R": "SHOT3PTRIGHT",
-            "TCONTMID": "CONTESTEDJUMPERMID",
-            "TCONT3PT": "CONTESTEDJUMPER3PT",
-            "TSBMID": "STEPBACKJUMPERMID",
-            "TSB3PT": "STEPBACKJUMPER3PT",
-            # Spin Jumper tendency abbreviation
-            "TSPINJ": "SPINJUMPERTENDENCY",
-            # Transition pull‑up 3pt (not drive)
-            "TTPU3PT": "TRANSITIONPULLUP3PT",
-            "TDPUMID": "DRIVEPULLUPMID",
-            "TDPU3PT": "DRIVEPULLUP3PT",
-            "TDRIVE": "DRIVE",
-            "TSUDRIVE": "SPOTUPDRIVE",
-            "TOSDRIVE": "OFFSCREENDRIVE",
-            # Use Glass tendency; map to USEGLASS rather than Crash
-            "TGLASS": "USEGLASS",
-            "TSTHRU": "STEPTHROUGHSHOT",
-            "TDRLAYUP": "DRIVINGLAYUPTENDENCY",
-            "TSPLAYUP": "STANDINGLAYUPTENDENCY",
-            "TEURO": "EUROSTEP",
-            "THOPSTEP": "HOPSTEP",
-            "TFLOATER": "FLOATER",
-            "TSDUNK": "STANDINGDUNKTENDENCY",
-            "TDDUNK": "DRIVINGDUNKTENDENCY",
-            "TFDUNK": "FLASHYDUNKTENDENCY",
-            # Alley‑oop dunk tendency
-            "TAOOP": "ALLEYOOP",
-            "TPUTBACK": "PUTBACK",
-            "TCRASH": "CRASH",
-            # Drive‑R abbreviation represents Drive Right
-            "TDRIVER": "DRIVERIGHT",
-            "TTTPFAKE": "TRIPLETHREATPUMPFAKE",
-            "TJABSTEP": "TRIPLETHREATJABSTEP",
-            "TTTIDLE": "TRIPLETHREATIDLE",
-            "TTTSHOOT": "TRIPLETHREATSHOOT",
-            # Setup moves (Sizeup and Hesitation) and no setup
-            "TSIZEUP": "SETUPWITHSIZEUP",
-            "THSTTN": "SETUPWITHHESITATION",
-            "TNOSETUP": "NOSETUPDRIBBLE",
-            # Dribble move abbreviations map to their driving variants
-            "TXOVER": "DRIVINGCROSSOVER",
-            "T2XOVER": "DRIVINGDOUBLECROSSOVER",
-            # TSPIN abbreviation corresponds to the driving spin dribble move
-            "TSPIN": "DRIVINGSPIN",
-            # Half spin corresponds to driving half spin
-            "THSPIN": "DRIVINGHALFSPIN",
-            # Stepback corresponds to driving stepback
-            "TSBACK": "DRIVINGSTEPBACK",
-            # Behind‑the‑back corresponds to driving behind the back
-            "TBBACK": "DRIVINGBEHINDBACK",
-            # Double hesitation corresponds to driving dribble hesitation
-            "TDHSTTN": "DRIVINGDRIBBLEHESITATION",
-            "TINNOUT": "INANDOUT",
-            "TNODRIB": "NODRIBBLE",
-            "TFINISH": "ATTACKSTRONGONDRIVE",  # finish = attack strong on drive
-            "TDISH": "DISHTOOPENMAN",  # dish = dish to open man
-            "TFLASHYP": "FLASHYPASS",
-            "TAOOPP": "ALLEYOOPPASS",
-            # Roll vs Pop ratio (pick and roll) maps to RollVsPop
-            "TROLLPOP": "ROLLVSPOP",
-            "TSPOTCUT": "SPOTUPCUT",
-            "TISOVSE": "ISOVSE",
-            "TISOVSG": "ISOVSG",
-            "TISOVSA": "ISOVSA",
-            "TISOVSP": "ISOVSP",
-            "TPLYDISC": "PLAYDISCIPLINE",
-            "TPOSTUP": "POSTUP",
-            "TPBDOWN": "POSTBACKDOWN",
-            "TPAGGBD": "POSTAGGRESSIVEBACKDOWN",
-            "TPFACEUP": "POSTFACEUP",
-            "TPSPIN": "POSTSPIN",
-            "TPDRIVE": "POSTDRIVE",
-            "TPDSTEP": "POSTDROPSTEP",
-            "TPHSTEP": "POSTHOPSTEP",
-            "TPSHOOT": "POSTSHOT",
-            "TPHOOKL": "POSTHOOKLEFT",
-            "TPHOOKR": "POSTHOOKRIGHT",
-            "TPFADEL": "POSTFADELEFT",
-            "TPFADER": "POSTFADERIGHT",
-            "TPSHIMMY": "POSTSHIMMY",
-            "TPHSHOT": "POSTHOPSHOT",
-            "TPSBSHOT": "POSTSTEPBACKSHOT",
-            "TPUPNUND": "POSTUPANDUNDER",
-            "TTAKEC": "TAKECHARGE",
-            # General foul tendency
-            "TFOUL": "FOUL",
-            "THFOUL": "HARDFOUL",
-            # Pass Interception tendency
-            "TPINTERC": "PASSINTERCEPTION",
-            "TSTEAL": "STEAL",
-            "TBLOCK": "BLOCK",
-            "TCONTEST": "CONTEST",
-        }
-        # Replace slashes in SPD/BALL etc.
-        # Normalize specific patterns
-        # Example: SPD/BALL -> SPDBALL, PASS_IQ -> PASSIQ
-        if norm in header_synonyms:
-            return header_synonyms[norm]
-        return norm
-
-    def _normalize_field_name(self, name: str) -> str:
-        """
-        Normalize a field name from the offset map for matching.
-
-        This helper performs uppercase conversion and removal of
-        non‑alphanumeric characters.  No synonyms are applied here since
-        the field names are already descriptive.
+        Results are memoized; an import re-normalizes the same headers for
+        every player row.
         """
-        import re as _re
-
-        return _re.sub(r"[^A-Za-z0-9]", "", str(name).upper())
-
-    def _reorder_categories(self) -> None:
+        norm = _normalize_name(name)
+        # Apply known header synonyms; map abbreviations to canonical
+        # attribute names.  Only a subset of synonyms is defined in
+        # ``HEADER_SYNONYMS``; any unknown name will fall back to its
+        # normalized form.  Slashes and underscores are already gone at this
+        # point, e.g. SPD/BALL -> SPDBALL, PASS_IQ -> PASSIQ.
+        return _HEADER_SYNONYMS.get(norm, norm)
+
+    # Normalize a field name from the offset map for matching: uppercase
+    # conversion and removal of non‑alphanumeric characters.  No synonyms are
+    # applied here since the field names are already descriptive.  This is
+    # the memoized ``_normalize_name`` itself rather than a wrapper around
+    # it, so each call goes straight to the cache.
+    _normalize_field_name = staticmethod(_normalize_name)
+
+    def _reorder_categories(
+        self, cats: dict[str, list[dict]]
+    ) -> dict[str, list[dict]]:
         """
         Reorder the categories and fields based on predefined import orders
         and group durability fields into their own category.
 
-        This method modifies ``self.categories`` in place.  It does the
-        following:
+        This method rearranges ``cats`` and returns it as a new dict in the
+        preferred category order.  It does the following:
 
         * Moves any attribute whose name contains ``Durability`` (case
           insensitive) into a new category called ``Durability``.
@@ -1575,7 +2545,7 @@ class PlayerDataModel:
           header names.  Unmatched fields remain at the end.
         """
         # Ensure the categories dict exists
-        cats = self.categories or {}
+        cats = cats or {}
         # ------------------------------------------------------------------
         # Extract durability fields from Attributes
         if "Attributes" in cats:
@@ -1599,28 +2569,23 @@ class PlayerDataModel:
             if cat_name not in cats:
                 return
             fields = cats[cat_name]
-            # Build a list of remaining fields
-            remaining = list(fields)
+            # Index the normalized field names once; matched fields are
+            # flagged in the ``used`` bytearray rather than popped from a
+            # shrinking list.
+            match_field = _fuzzy_name_matcher(
+                [self._normalize_field_name(f.get("name", "")) for f in fields]
+            )
+            used = bytearray(len(fields))
             reordered: list[dict] = []
             for hdr in import_order:
-                norm_hdr = self._normalize_header_name(hdr)
-                match_idx = -1
-                # Find the first field whose normalized name matches or
-                # contains the normalized header name.
-                for i, f in enumerate(remaining):
-                    norm_field = self._normalize_field_name(f.get("name", ""))
-                    # Exact or partial match
-                    if (
-                        norm_hdr == norm_field
-                        or norm_hdr in norm_field
-                        or norm_field in norm_hdr
-                    ):
-                        match_idx = i
-                        break
-                if match_idx >= 0:
-                    reordered.append(remaining.pop(match_idx))
-            # Append any unmatched fields at the end
-            reordered.extend(remaining)
+                # Find the first unused field whose normalized name matches,
+                # contains or is contained in the normalized header name.
+                i = match_field(self._normalize_header_name(hdr), used)
+                if i >= 0:
+                    used[i] = 1
+                    reordered.append(fields[i])
+            # Append any unmatched fields at the end in their original order
+            reordered.extend(f for f, u in zip(fields, used) if not u)
             cats[cat_name] = reordered
 
         # Reorder attributes, tendencies, durability
@@ -1629,7 +2594,6 @@ class PlayerDataModel:
         reorder("Durability", DUR_IMPORT_ORDER)
         # Save back in a deterministic order.  We prefer to display
         # categories in a consistent order matching the import tables.
-        ordered = {}
         preferred = [
             "Body",
             "Vitals",
@@ -1638,14 +2602,12 @@ class PlayerDataModel:
             "Tendencies",
             "Badges",
         ]
-        for name in preferred:
-            if name in cats:
-                ordered[name] = cats[name]
-        # Append any remaining categories not listed above
-        for name, fields in cats.items():
-            if name not in ordered:
-                ordered[name] = fields
-        self.categories = ordered
+        rank = {name: i for i, name in enumerate(preferred)}
+        # The sort is stable, so any remaining categories not listed above
+        # follow in their original order.
+        return dict(
+            sorted(cats.items(), key=lambda item: rank.get(item[0], len(rank)))
+        )
 
     def find_player_indices_by_name(self, name: str) -> list[int]:
         """
@@ -1659,29 +2621,12 @@ class PlayerDataModel:
             match the given name (case‑insensitive).  If no match is found
             returns an empty list.
         """
-        name = str(name or "").strip()
-        if not name:
-            return []
-        parts = name.split()
-        if not parts:
-            return []
-        first = parts[0].strip()
-        last = " ".join(parts[1:]).strip() if len(parts) > 1 else ""
-        # Use the name_index_map for efficient lookup if available
-        key = f"{first.lower()} {last.lower()}".strip()
-        if self.name_index_map:
-            return self.name_index_map.get(key, [])
-        # Fallback: linear scan over players
-        indices: list[int] = []
-        for p in self.players:
-            if (
-                p.first_name.lower() == first.lower()
-                and p.last_name.lower() == last.lower()
-            ):
-                indices.append(p.index)
-        return indices
+        # ``name_index_map`` is keyed by ``_player_name_key`` of the "first
+        # last" name and is rebuilt whenever ``self.players`` is, so a lookup
+        # is a single dict probe.  The empty key is never indexed.
+        return self.name_index_map.get(_player_name_key(str(name or "")), [])
 
-    def import_table(self, category_name: str, filepath: str) -> int:
+    def import_table(self, category_name: str, filepath: str | IO[str]) -> int:
         """
         Import player data from a tab- or comma-delimited file for a single category.
 
@@ -1695,33 +2640,67 @@ class PlayerDataModel:
         Args:
             category_name: Name of the category to import (e.g. "Attributes",
                 "Tendencies", "Durability").
-            filepath: Path to the import file.
+            filepath: Path to the import file, or a seekable text stream
+                (e.g. ``io.StringIO``) holding the table already in memory.
+                A stream is read from its start and left open.
 
         Returns:
             The number of players successfully updated.
         """
-        import csv as _csv
-
         # Ensure category exists
         if category_name not in self.categories:
             return 0
-        # Open file
-        try:
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                # Try to detect delimiter: prefer tab, then comma, semicolon
-                sample = f.readline()
-                delim = "\t" if "\t" in sample else "," if "," in sample else ";"
-                # Reset file pointer
+        # In-memory tables are read as they are, without a temporary file
+        if not isinstance(filepath, (str, os.PathLike)):
+            f = filepath
+            try:
                 f.seek(0)
-                reader = _csv.reader(f, delimiter=delim)
-                rows = list(reader)
+            except Exception:
+                return 0
+            return self._import_stream(category_name, f)
+        # Open file.  Rows are streamed from the reader rather than loaded
+        # into a list first, and a 1 MiB buffer keeps large imports to a
+        # handful of read calls.
+        try:
+            f = open(
+                filepath,
+                "r",
+                encoding="utf-8",
+                errors="ignore",
+                newline="",
+                buffering=1 << 20,
+            )
         except Exception:
             return 0
-        if not rows:
+        with f:
+            return self._import_stream(category_name, f)
+
+    def _import_stream(self, category_name: str, f: IO[str]) -> int:
+        """Detect the delimiter of the open table ``f`` and import its rows."""
+        import csv as _csv
+
+        try:
+            # Try to detect delimiter: prefer tab, then comma, semicolon
+            sample = f.readline()
+            delim = "\t" if "\t" in sample else "," if "," in sample else ";"
+            # Reset file pointer
+            f.seek(0)
+            reader = _csv.reader(f, delimiter=delim)
+            header = next(reader, None)
+        except Exception:
             return 0
-        header = rows[0]
         if not header or len(header) < 2:
             return 0
+        return self._import_rows(category_name, header, reader)
+
+    def _import_rows(self, category_name: str, header: list[str], rows) -> int:
+        """
+        Apply the data rows of an import file to the players they name.
+
+        ``header`` is the file's header row and ``rows`` an iterable over the
+        remaining rows (e.g. the ``csv.reader`` that produced the header).
+        Returns the number of players updated; see ``import_table``.
+        """
         # Build mapping list: for each column after the first, find the field
         # definition in the category.  For Attributes, we use fuzzy name
         # matching; for Tendencies and Durability we rely on column order
@@ -1731,105 +2710,127 @@ class PlayerDataModel:
         # without explicit synonyms.
         field_defs = self.categories[category_name]
         mappings: list[dict | None] = []
-        # Build normalized field names list once for matching
-        norm_fields: list[tuple[str, dict]] = []
-        for f in field_defs:
-            n = self._normalize_field_name(f.get("name", ""))
-            norm_fields.append((n, f))
+        # Index the normalized field names once for matching
+        match_field = _fuzzy_name_matcher(
+            [self._normalize_field_name(f.get("name", "")) for f in field_defs]
+        )
         # For each column header (skipping player name) attempt to match by name
         for i, col in enumerate(header[1:]):
-            n_hdr = self._normalize_header_name(col)
-            matched: dict | None = None
-            # First attempt fuzzy match: exact or substring in either direction
-            for norm_field, f in norm_fields:
-                if n_hdr == norm_field or n_hdr in norm_field or norm_field in n_hdr:
-                    matched = f
-                    break
+            # Fuzzy match: the first field that equals the header or is a
+            # substring of it in either direction
+            hit = match_field(self._normalize_header_name(col))
+            matched: dict | None = field_defs[hit] if hit >= 0 else None
             if matched is None:
                 # Fallback: map by position if within range
                 if i < len(field_defs):
                     matched = field_defs[i]
             mappings.append(matched)
+        # Resolve each mapped field's location once.  Offset, start bit and
+        # length are the same for every row, so the rows below only parse
+        # and convert their values.
+        resolved: list[tuple[int, int, int] | None] = []
+        for meta in mappings:
+            if meta is None:
+                resolved.append(None)
+                continue
+            # Offsets in the offset map may be strings (e.g. "0x392"), so
+            # handle hex prefixes gracefully.  If the offset cannot be
+            # parsed, default to zero.
+            off_raw = meta.get("offset", 0)
+            try:
+                if isinstance(off_raw, str):
+                    off_str = off_raw.strip()
+                    # Allow hex prefixes (0x...) and decimal
+                    if off_str.lower().startswith("0x"):
+                        offset = int(off_str, 16)
+                    else:
+                        offset = int(off_str, 0)
+                else:
+                    offset = int(off_raw)
+            except Exception:
+                offset = 0
+            start_bit = int(
+                meta["startBit"] if "startBit" in meta else meta.get("start_bit", 0)
+            )
+            length = int(meta.get("length", 0))
+            resolved.append((offset, start_bit, length))
+        # Pick the rating conversion for the category once
+        if category_name in ("Attributes", "Durability"):
+            # Interpret the imported value directly as a rating on the 25–99
+            # scale and convert to raw.  Values outside the expected range
+            # are clamped internally.
+            convert = convert_rating_to_raw
+        elif category_name == "Tendencies":
+            # Tendencies are 0–100 scale; convert accordingly
+            convert = convert_rating_to_tendency_raw
+        else:
+            # Other categories (if any) are assumed to be percentages
+            # ranging 0..100.  Map linearly to the raw bitfield range.
+            def convert(num: float, length: int) -> int:
+                max_raw = (1 << length) - 1
+                if max_raw <= 0:
+                    return 0
+                pct = min(max(num, 0.0), 100.0) / 100.0
+                return int(round(pct * max_raw))
+
+        # A file holds only a few dozen distinct ratings per field width, so
+        # each (value, length) pair is converted once and then looked up.
+        converted: dict[tuple[float, int], int] = {}
         # Process each row
         players_updated = 0
-        for row in rows[1:]:
+        # Each row's name is normalized once and probed in the index
+        # directly.  Blank and whitespace-only names (e.g. trailing separator
+        # lines) give the empty key, which is never indexed.
+        find_player = self.name_index_map.get
+        name_key = _player_name_key
+        for row in rows:
             if not row or len(row) < 2:
                 continue
-            name = row[0].strip()
-            values = row[1:]
-            idxs = self.find_player_indices_by_name(name)
+            idxs = find_player(name_key(row[0]))
             if not idxs:
                 continue
-            # Apply values to each matching player
-            for idx in idxs:
-                any_set = False
-                for val, meta in zip(values, mappings):
-                    if meta is None:
-                        continue
-                    # Retrieve offset, start_bit and length.  Offsets in
-                    # the offset map may be strings (e.g. "0x392"), so
-                    # handle hex prefixes gracefully.  If the offset
-                    # cannot be parsed, default to zero.
-                    off_raw = meta.get("offset", 0)
-                    try:
-                        if isinstance(off_raw, str):
-                            off_str = off_raw.strip()
-                            # Allow hex prefixes (0x...) and decimal
-                            if off_str.lower().startswith("0x"):
-                                offset = int(off_str, 16)
-                            else:
-                                offset = int(off_str, 0)
-                        else:
-                            offset = int(off_raw)
-                    except Exception:
-                        offset = 0
-                    start_bit = int(meta.get("startBit", meta.get("start_bit", 0)))
-                    length = int(meta.get("length", 0))
-                    # Convert string value to integer; ignore non‑numeric
-                    try:
+            values = row[1:]
+            # Convert the row's values to raw bits once; they are written
+            # unchanged to every matching player.
+            updates: list[tuple[int, int, int, int]] = []
+            for val, rm in zip(values, resolved):
+                if rm is None:
+                    continue
+                offset, start_bit, length = rm
+                # Convert string value to integer; ignore non‑numeric
+                try:
+                    if val.isascii() and val.isdigit():
+                        # Plain ratings like "85" need no cleaning
+                        num = float(val)
+                    else:
                         # Remove percentage signs or other non-digits
-                        import re as _re
-
-                        v = _re.sub(r"[^0-9.-]", "", str(val))
+                        v = _IMPORT_VALUE_STRIP_RE.sub("", val)
                         if not v:
                             continue
                         num = float(v)
-                    except Exception:
-                        continue
-                    # Convert numeric value to raw bits
-                    max_raw = (1 << length) - 1
-                    if category_name in ("Attributes", "Durability"):
-                        # Interpret the imported value directly as a rating on
-                        # the 25–99 scale and convert to raw.  Values
-                        # outside the expected range are clamped internally.
-                        raw = convert_rating_to_raw(num, length)
-                    elif category_name == "Tendencies":
-                        # Tendencies are 0–100 scale; convert accordingly
-                        raw = convert_rating_to_tendency_raw(num, length)
-                    else:
-                        # Other categories (if any) are assumed to be
-                        # percentages ranging 0..100.  Map linearly to the
-                        # raw bitfield range.
-                        if max_raw > 0:
-                            pct = min(max(num, 0.0), 100.0) / 100.0
-                            raw = int(round(pct * max_raw))
-                        else:
-                            raw = 0
-                    # Write value
-                    if self.set_field_value(idx, offset, start_bit, length, raw):
-                        any_set = True
-                if any_set:
+                except Exception:
+                    continue
+                # Convert numeric value to raw bits
+                key = (num, length)
+                raw = converted.get(key)
+                if raw is None:
+                    raw = converted[key] = convert(num, length)
+                updates.append((offset, start_bit, length, raw))
+            # Apply values to each matching player, coalescing the writes
+            for idx in idxs:
+                if self.set_field_values_bulk(idx, updates):
                     players_updated += 1
         return players_updated
 
-    def import_all(self, file_map: dict[str, str]) -> dict[str, int]:
+    def import_all(self, file_map: dict[str, str | IO[str]]) -> dict[str, int]:
         """
         Import multiple tables from a mapping of category names to file paths.
 
         Args:
             file_map: A mapping of category names ("Attributes", "Tendencies",
-                "Durability") to file paths.  If a file path is an empty
-                string or does not exist, that category will be skipped.
+                "Durability") to file paths or in-memory text streams (see
+                ``import_table``).  If a file path is an empty string or
+                does not exist, that category will be skipped.
 
         Returns:
             A dictionary mapping category names to the number of players
@@ -1837,12 +2838,59 @@ class PlayerDataModel:
         """
         results: dict[str, int] = {}
         for cat, path in file_map.items():
-            if not path or not os.path.isfile(path):
+            if isinstance(path, (str, os.PathLike)) and (
+                not path or not os.path.isfile(path)
+            ):
                 results[cat] = 0
                 continue
             results[cat] = self.import_table(cat, path)
         return results
 
+    def import_all_rows(self, rows_map: dict[str, list[list[str]]]) -> dict[str, int]:
+        """
+        Import multiple tables that have already been parsed into rows.
+
+        This is ``import_all`` for callers that hold the table contents in
+        memory (downloaded sheets, or files they have read once with
+        ``read_table_rows`` to inspect the names), so nothing is written to
+        or re-read from disk.
+
+        Args:
+            rows_map: A mapping of category names to table rows, the first
+                row being the header.  Categories with no rows, an unknown
+                name or fewer than two header columns import nothing.
+
+        Returns:
+            A dictionary mapping category names to the number of players
+            updated for each category.
+        """
+        results: dict[str, int] = {}
+        for cat, rows in rows_map.items():
+            if not rows or cat not in self.categories or len(rows[0]) < 2:
+                results[cat] = 0
+                continue
+            results[cat] = self._import_rows(cat, rows[0], itertools.islice(rows, 1, None))
+        return results
+
+    @staticmethod
+    def read_table_rows(filepath: str) -> list[list[str]]:
+        """
+        Read every row of a tab-, comma- or semicolon-delimited file.
+
+        The delimiter is detected from the first line exactly as in
+        ``import_table``.  Returns an empty list if the file cannot be read.
+        """
+        import csv as _csv
+
+        try:
+            with open(filepath, "r", encoding="utf-8", errors="ignore", newline="") as f:
+                sample = f.readline()
+                delim = "\t" if "\t" in sample else "," if "," in sample else ";"
+                f.seek(0)
+                return list(_csv.reader(f, delimiter=delim))
+        except Exception:
+            return []
+
     # ---------- NEW: string/label helpers ----------
     @staticmethod
     def _is_printable_ascii(s: str, min_len: int = 2, max_len: int = 48) -> bool:
@@ -1868,25 +2916,32 @@ class PlayerDataModel:
         # all characters must be printable; allow any printable unicode
         if not s.isprintable():
             return False
-        # require at least two alphabetic characters
-        letters = sum(ch.isalpha() for ch in s)
-        return letters >= 2
+        # require at least two alphabetic characters.  Nearly every name is
+        # ASCII, where deleting the non-letters with ``bytes.translate``
+        # counts them in C; otherwise stop as soon as two letters are seen.
+        if s.isascii():
+            return len(s.encode("ascii").translate(None, _ASCII_NON_LETTERS)) >= 2
+        letters = 0
+        for ch in s:
+            if ch.isalpha():
+                letters += 1
+                if letters >= 2:
+                    return True
+        return False
 
     @staticmethod
     def _dedupe_team_names(pairs: list[tuple[int, str]]) -> list[tuple[int, str]]:
         """If multiple teams share the same display name, append the index to disambiguate."""
-        from collections import Counter, defaultdict
+        from collections import Counter
 
         counts = Counter(name for _, name in pairs)
-        seen: defaultdict[str, int] = defaultdict(int)
-        out: list[tuple[int, str]] = []
-        for idx, name in pairs:
-            if counts[name] > 1:
-                seen[name] += 1
-                out.append((idx, f"{name} [{idx}]"))
-            else:
-                out.append((idx, name))
-        return out
+        if len(counts) == len(pairs):
+            # Nothing is repeated (the usual case)
+            return pairs
+        return [
+            (idx, f"{name} [{idx}]" if counts[name] > 1 else name)
+            for idx, name in pairs
+        ]
 
     @staticmethod
     def _format_historic_year(val: int) -> str:
@@ -1917,8 +2972,8 @@ class PlayerDataModel:
         # field to decide whether to append the year.
         year_val = 0
         try:
-            raw_year = self.mem.read_uint16(team_ptr + TEAM_YEAR_OFFSET)
-            year_val = (raw_year >> 3) & 0x7F
+            yb = self.mem.read_bytes(team_ptr + TEAM_YEAR_OFFSET, 2)
+            year_val = TEAM_YEAR_LUT_LO[yb[0]] | TEAM_YEAR_LUT_HI[yb[1]]
         except Exception:
             year_val = 0
         if year_val > 0:
@@ -1927,6 +2982,14 @@ class PlayerDataModel:
                 name = f"{name} {year_str}"
         return name if self._is_printable_ascii(name) else "Unknown"
 
+    def _team_name_for_ptr(self, team_ptr: int) -> str:
+        """Return ``_compose_team_name_from_ptr(team_ptr)``, cached per scan."""
+        name = self._team_name_by_ptr.get(team_ptr)
+        if name is None:
+            name = self._compose_team_name_from_ptr(team_ptr)
+            self._team_name_by_ptr[team_ptr] = name
+        return name
+
     # ---------------------------------------------------------------------
     # In‑memory team and player scanning
     # ---------------------------------------------------------------------
@@ -1937,8 +3000,8 @@ class PlayerDataModel:
         "Team Data" table to locate the base of the team records.  It then
         iterates over the first MAX_TEAMS_SCAN records, reading the team name
         string from each record.  Invalid or noisy strings (non-printable ASCII
-        or too short) are skipped.  Scanning stops only after a run of
-        several invalid entries and some valid teams have been found.
+        or too short) are skipped, and all MAX_TEAMS_SCAN records are
+        scanned so teams behind a gap of unused slots are still found.
         Duplicate display names are disambiguated by appending the raw team
         index (e.g. "Bulls [87]").
 
@@ -1950,36 +3013,44 @@ class PlayerDataModel:
         base = self._resolve_team_base_ptr()
         if base is None:
             return []
+        # As with the player table, read all team records in one call and
+        # fall back to record‑by‑record reads if the whole span is not
+        # readable.  Unreadable records are skipped (their name would be
+        # empty and rejected anyway).
+        size = MAX_TEAMS_SCAN * TEAM_STRIDE
+        if self._team_block is None or len(self._team_block) != size:
+            self._team_block = bytearray(size)
+        block = memoryview(self._team_block)
+        readable: list[bool] | None = None
+        try:
+            self.mem.read_block(base, block)
+        except Exception:
+            readable = [False] * MAX_TEAMS_SCAN
+            for team_idx in range(MAX_TEAMS_SCAN):
+                rec = team_idx * TEAM_STRIDE
+                try:
+                    self.mem.read_block(base + rec, block[rec : rec + TEAM_STRIDE])
+                    readable[team_idx] = True
+                except Exception:
+                    continue
         results: list[tuple[int, str]] = []
         self.team_types.clear()
-        for team_idx in range(MAX_TEAMS_SCAN):
-            try:
-                raw = self.mem.read_wstring(
-                    base + team_idx * TEAM_STRIDE + TEAM_NAME_OFFSET, TEAM_NAME_LENGTH
-                ).strip()
-            except Exception:
-                raw = ""
-            name = raw
-            # Determine roster type and historic year
-            try:
-                t_byte = self.mem.read_uint8(
-                    base + team_idx * TEAM_STRIDE + TEAM_TYPE_OFFSET
-                )
-                t_val = (t_byte >> 2) & 0x1F
-            except Exception:
-                t_val = 0
+        rows = _TEAM_SCAN_RECORD.iter_unpack(block)
+        for team_idx, (name_raw, type_byte, year_lo, year_hi) in enumerate(rows):
+            if readable is not None and not readable[team_idx]:
+                # Matches the old per-field reads failing: no name, type 0
+                self.team_types[team_idx] = 0
+                continue
+            name = _decode_wstring(name_raw, 0, TEAM_NAME_LENGTH).strip()
             # Store roster type for later categorization but don't rely on it
-            self.team_types[team_idx] = t_val
+            self.team_types[team_idx] = TEAM_TYPE_LUT[type_byte]
+            if not name:
+                # Unused slot.  A season suffix alone has no letters, so the
+                # name would be rejected below anyway.
+                continue
             # Attempt to append historic year regardless of roster type. Many
             # classic and decade teams encode their season in the year field.
-            year_val = 0
-            try:
-                year_raw = self.mem.read_uint16(
-                    base + team_idx * TEAM_STRIDE + TEAM_YEAR_OFFSET
-                )
-                year_val = (year_raw >> 3) & 0x7F
-            except Exception:
-                year_val = 0
+            year_val = TEAM_YEAR_LUT_LO[year_lo] | TEAM_YEAR_LUT_HI[year_hi]
             if year_val > 0:
                 year_str = self._format_historic_year(year_val)
                 if year_str:
@@ -1989,9 +3060,46 @@ class PlayerDataModel:
         # Disambiguate duplicate names so UI can map the right index
         results = self._dedupe_team_names(results)
         # cache for other features
-        self.team_list = results
+        self._set_team_list(results)
         return results
 
+    def _set_team_list(self, pairs: list[tuple[int, str]]) -> None:
+        """Assign ``team_list`` and rebuild its name -> index lookup."""
+        self.team_list = pairs
+        # Iterate in reverse so the first index wins for repeated names,
+        # matching a front-to-back search of ``team_list``.
+        self._team_name_to_idx = {name: idx for idx, name in reversed(pairs)}
+        self._recompute_team_categories()
+
+    def _recompute_team_categories(self) -> None:
+        """Classify each ``team_list`` entry for ``get_teams``.
+
+        Entry ``i`` of ``_team_categories`` is the display group of
+        ``team_list[i]``, numbered in display order: 0 free agents, 1 draft
+        class, 2 standard, 3 historic, 4 all-time, 5 G-League.  Team types
+        are only written by ``_scan_team_names`` just before it assigns the
+        team list, so the classification stays valid until the next
+        ``_set_team_list``.
+        """
+        types_get = self.team_types.get
+        categories: list[int] = []
+        for idx, name in self.team_list:
+            ln = name.lower()
+            t = types_get(idx, 0)
+            if "free" in ln:
+                categories.append(0)
+            elif "draft" in ln:
+                categories.append(1)
+            elif t in (1, 24):
+                categories.append(3)
+            elif t == 25 or "all time" in ln or "all-time" in ln:
+                categories.append(4)
+            elif "gleague" in ln or "g league" in ln or "g-league" in ln:
+                categories.append(5)
+            else:
+                categories.append(2)
+        self._team_categories = categories
+
     def scan_team_players(self, team_idx: int) -> list[Player]:
         """Retrieve the list of players on a given team.
 
@@ -2016,13 +3124,24 @@ class PlayerDataModel:
         if team_base_ptr is None:
             return []
         rec_addr = team_base_ptr + team_idx * TEAM_STRIDE
+        # The roster slots are consecutive pointers at the start of the team
+        # record; read them all at once.  If the span is not readable, fall
+        # back to one read per slot, treating unreadable slots as empty.
+        try:
+            slots = struct.unpack(
+                f"<{TEAM_PLAYER_SLOT_COUNT}Q",
+                self.mem.read_bytes(rec_addr, TEAM_PLAYER_SLOT_COUNT * 8),
+            )
+        except Exception:
+            slots = []
+            for slot in range(TEAM_PLAYER_SLOT_COUNT):
+                try:
+                    slots.append(self.mem.read_uint64(rec_addr + slot * 8))
+                except Exception:
+                    # Skip this slot if pointer read fails
+                    slots.append(0)
         players: list[Player] = []
-        for slot in range(TEAM_PLAYER_SLOT_COUNT):
-            try:
-                ptr = self.mem.read_uint64(rec_addr + slot * 8)
-            except Exception:
-                # Skip this slot if pointer read fails
-                continue
+        for ptr in slots:
             # Skip null pointers
             if not ptr:
                 continue
@@ -2032,15 +3151,13 @@ class PlayerDataModel:
             except Exception:
                 idx = -1
             try:
-                last_name = self.mem.read_wstring(
-                    ptr + OFF_LAST_NAME, NAME_MAX_CHARS
-                ).strip()
-                first_name = self.mem.read_wstring(
-                    ptr + OFF_FIRST_NAME, NAME_MAX_CHARS
-                ).strip()
-                face_id = self.mem.read_uint32(ptr + OFF_FACE_ID)
+                # One read per player; the fields are sliced from the copy
+                record = self.mem.read_player_record(ptr)
+                last_raw, first_raw, face_id, _ = _unpack_player_record(record, 0)
+                last_name = _decode_wstring(last_raw, 0, NAME_MAX_CHARS).strip()
+                first_name = _decode_wstring(first_raw, 0, NAME_MAX_CHARS).strip()
             except Exception:
-                # Skip this player if any field cannot be read
+                # Skip this player if the record cannot be read
                 continue
             if not first_name and not last_name:
                 continue
@@ -2085,8 +3202,20 @@ class PlayerDataModel:
         if team_base_ptr is None:
             return None
         rec_addr = team_base_ptr + team_idx * TEAM_RECORD_SIZE
+        # Read the span covering every field once and decode each field from
+        # it.  If the span cannot be read, fall back to per-field reads so a
+        # single unreadable field still only blanks that field.
+        lo = min(offset for offset, _ in TEAM_FIELDS.values())
+        hi = max(offset + max_chars * 2 for offset, max_chars in TEAM_FIELDS.values())
+        try:
+            span = self.mem.read_bytes(rec_addr + lo, hi - lo)
+        except Exception:
+            span = None
         fields: Dict[str, str] = {}
         for label, (offset, max_chars) in TEAM_FIELDS.items():
+            if span is not None:
+                fields[label] = _decode_wstring(span, offset - lo, max_chars).rstrip("\x00")
+                continue
             try:
                 val = self.mem.read_wstring(rec_addr + offset, max_chars).rstrip("\x00")
             except Exception:
@@ -2114,6 +3243,7 @@ class PlayerDataModel:
         """
         if not self.mem.hproc or self.mem.base_addr is None:
             return False
+        self._refreshed_at = None
         team_base_ptr = self._resolve_team_base_ptr()
         if team_base_ptr is None:
             return False
@@ -2146,136 +3276,196 @@ class PlayerDataModel:
         table_base = self._resolve_player_table_base()
         if table_base is None:
             return []
+        # Read the whole table with one ReadProcessMemory call instead of
+        # four small reads per record.  If the span cannot be read in one go
+        # (e.g. the end of the table borders unmapped memory), fall back to
+        # reading record by record into the same buffer and skip records
+        # that cannot be read, as the per‑field scan used to do.
+        size = max_scan * PLAYER_STRIDE
+        if self._player_block is None or len(self._player_block) != size:
+            self._player_block = bytearray(size)
+        block = memoryview(self._player_block)
+        readable: list[bool] | None = None
+        try:
+            self.mem.read_block(table_base, block)
+        except Exception:
+            readable = [False] * max_scan
+            for i in range(max_scan):
+                rec = i * PLAYER_STRIDE
+                try:
+                    self.mem.read_block(
+                        table_base + rec, block[rec : rec + PLAYER_STRIDE]
+                    )
+                    readable[i] = True
+                except Exception:
+                    continue
+        # A checksum of the table is far cheaper than decoding it, so reuse
+        # the previous records when nothing in the table has changed.
+        fingerprint = (
+            table_base,
+            max_scan,
+            None if readable is None else tuple(readable),
+            zlib.crc32(block),
+        )
+        if fingerprint == self._scan_fingerprint:
+            records = self._scan_records
+        else:
+            records = self._decode_player_records(block, max_scan, readable)
+            self._scan_fingerprint = fingerprint
+            self._scan_records = records
         players: list[Player] = []
-        for i in range(max_scan):
-            p_addr = table_base + i * PLAYER_STRIDE
-            try:
-                last_name = self.mem.read_wstring(
-                    p_addr + OFF_LAST_NAME, NAME_MAX_CHARS
-                ).strip()
-                first_name = self.mem.read_wstring(
-                    p_addr + OFF_FIRST_NAME, NAME_MAX_CHARS
-                ).strip()
-                face_id = self.mem.read_uint32(p_addr + OFF_FACE_ID)
-            except Exception:
-                continue
-            # Skip blank cards
-            if not first_name and not last_name:
-                continue
+        for i, first_name, last_name, face_id, team_ptr in records:
             team_name = "Unknown"
             try:
-                team_ptr = self.mem.read_uint64(p_addr + OFF_TEAM_PTR)
                 if team_ptr == 0:
                     team_name = "Free Agents"
                 else:
                     # Compose a display name that includes the historic year when applicable
-                    team_name = self._compose_team_name_from_ptr(team_ptr)
+                    team_name = self._team_name_for_ptr(team_ptr)
             except Exception:
                 pass
-            players.append(Player(i, first_name, last_name, team_name, face_id))
+            players.append(
+                Player(i, first_name, last_name, team_name, face_id, team_ptr)
+            )
+        return players
+
+    @staticmethod
+    def _decode_player_records(
+        block: memoryview, max_scan: int, readable: list[bool] | None
+    ) -> list[tuple[int, str, str, int, int]]:
+        """Decode ``(index, first, last, face_id, team_ptr)`` from a raw table.
+
+        Blank and unreadable records are skipped.  If the majority of names
+        contain non-ASCII characters the table is assumed to be garbage and
+        an empty list is returned.
+        """
+        records: list[tuple[int, str, str, int, int]] = []
+        rows = _iter_player_records(block, max_scan)
+        for i, (last_raw, first_raw, face_id, team_ptr) in enumerate(rows):
+            if readable is not None and not readable[i]:
+                continue
+            last_name = _decode_wstring(last_raw, 0, NAME_MAX_CHARS).strip()
+            first_name = _decode_wstring(first_raw, 0, NAME_MAX_CHARS).strip()
+            # Skip blank cards
+            if not first_name and not last_name:
+                continue
+            records.append((i, first_name, last_name, face_id, team_ptr))
         # Basic sanity heuristic: if majority of names are non-ASCII, treat scan as invalid
-        if players:
+        if records:
             allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ -'")
             junk = sum(
                 1
-                for p in players
-                if any(ch not in allowed for ch in (p.first_name + p.last_name))
+                for _, first_name, last_name, _, _ in records
+                if any(ch not in allowed for ch in (first_name + last_name))
             )
-            if junk > len(players) * 0.5:
+            if junk > len(records) * 0.5:
                 return []
-        return players
+        return records
 
     def refresh_players(self) -> None:
         """Populate team and player information."""
+        self._refreshed_at = None
+        self._scan_players_and_teams()
+        self._refreshed_at = time.monotonic()
+
+    def refresh_players_if_stale(self) -> None:
+        """Call ``refresh_players`` unless it completed within ``REFRESH_TTL``.
+
+        Opening several tools in a row would otherwise rescan the whole
+        roster each time.  Writes that change the player or team lists clear
+        the timestamp, so they are always followed by a real rescan.
+        """
+        refreshed_at = self._refreshed_at
+        if refreshed_at is None or time.monotonic() - refreshed_at > self.REFRESH_TTL:
+            self.refresh_players()
+
+    def _scan_players_and_teams(self) -> None:
+        """Read the team and player lists from memory (see ``refresh_players``)."""
         # Reset state
-        self.team_list = []
+        self._set_team_list([])
         self.players = []
         self.fallback_players = False
         self._resolved_player_base = None
         self._resolved_team_base = None
-        
+        self._chain_root_values = None
+        self._team_name_by_ptr.clear()
+
 
         if self.mem.open_process():
             team_base = self._resolve_team_base_ptr()
             if team_base is not None:
                 teams = self._scan_team_names()
                 if teams:
-                    # Sort teams, grouping those starting with 'Team ' last
-                    def _key(item: tuple[int, str]) -> tuple[int, str]:
-                        idx, name = item
-                        return (
-                            1 if name.strip().lower().startswith("team ") else 0,
-                            name,
-                        )
-
-                    self.team_list = sorted(teams, key=_key)
+                    # Sort teams, grouping those starting with 'Team ' last.
+                    # The prefix flag is computed once per team and the
+                    # sort runs on the decorated tuples (stable on equal
+                    # names, so slot order is kept for duplicates).
+                    decorated = [
+                        (1 if name.strip()[:5].lower() == "team " else 0, name, idx)
+                        for idx, name in teams
+                    ]
+                    decorated.sort(key=operator.itemgetter(0, 1))
+                    self._set_team_list([(idx, name) for _, name, idx in decorated])
                     return
             # Fallback: scan players and derive team names from their team pointers
             players = self._scan_all_players(self.max_players)
             if players:
                 # Attempt to disambiguate teams by their pointer when multiple
-                # historic teams share the same display name.  When scanning
-                # fails to resolve the team table, we still know the base of
-                # the player table.  Use it to re-read each player's team
-                # pointer and build a mapping from pointer -> display name.  If
-                # the year field can be read from the team record, include it
-                # in the display name; otherwise append a suffix to
-                # disambiguate duplicates.
+                # historic teams share the same display name.  The scan
+                # recorded each player's team pointer, so build a mapping
+                # from pointer -> display name from those.  If the year field
+                # can be read from the team record, include it in the display
+                # name; otherwise append a suffix to disambiguate duplicates.
                 ptr_to_name: Dict[int, str] = {}
                 name_to_ptrs: Dict[str, list[int]] = {}
-                table_base = self._resolve_player_table_base()
-                if table_base is not None:
-                    for p in players:
-                        p_addr = table_base + p.index * PLAYER_STRIDE
-                        try:
-                            ptr = self.mem.read_uint64(p_addr + OFF_TEAM_PTR)
-                        except Exception:
-                            ptr = 0
+                # Thousands of players share a few hundred pointers, so the
+                # lookups are bound once and each pointer is named once.
+                name_for_ptr = self._team_name_for_ptr
+                known_name = ptr_to_name.get
+                for p in players:
+                    ptr = p.team_ptr
+                    name = known_name(ptr)
+                    if name is None:
                         # Compose a display name directly from the pointer.
                         # This uses the unified offsets (TEAM_NAME_OFFSET and
                         # TEAM_YEAR_OFFSET) to append a historic season when
                         # available.  It will fall back to the base name or
                         # "Unknown" if anything fails.
-                        name = self._compose_team_name_from_ptr(ptr) if ptr else "Free Agents"
+                        name = name_for_ptr(ptr) if ptr else "Free Agents"
                         ptr_to_name[ptr] = name
-                        name_to_ptrs.setdefault(name, []).append(ptr)
-                    # For names that map to multiple pointers (i.e. still
-                    # identical after attempting to include the year), append
-                    # an index to disambiguate them.  This ensures that
-                    # classic teams with identical names remain separate.  The
-                    # ordering of indices is deterministic to maintain stable
-                    # names between scans.
-                    for name, ptrs in name_to_ptrs.items():
-                        if len(ptrs) > 1:
-                            seen: set[int] = set()
-                            unique_ptrs: list[int] = []
-                            for ptr in ptrs:
-                                if ptr not in seen:
-                                    seen.add(ptr)
-                                    unique_ptrs.append(ptr)
-                            for suffix_idx, ptr in enumerate(unique_ptrs):
-                                ptr_to_name[ptr] = f"{name} [{suffix_idx}]"
-                    # Update each player's team label based on the pointer
-                    for p in players:
-                        p_addr = table_base + p.index * PLAYER_STRIDE
-                        try:
-                            ptr = self.mem.read_uint64(p_addr + OFF_TEAM_PTR)
-                        except Exception:
-                            ptr = 0
-                        if ptr in ptr_to_name:
-                            p.team = ptr_to_name[ptr]
-                    unique_names = sorted(set(ptr_to_name.values()))
-                else:
-                    # Could not resolve player table again; fall back to name set
-                    unique_names = sorted({p.team for p in players})
-                # Apply the 'Team ' sorting heuristic
-                def _k(name: str) -> tuple[int, str]:
-                    return (1 if name.strip().lower().startswith("team ") else 0, name)
-                ordered_names = sorted(unique_names, key=_k)
-                # Convert to (index, name) pairs and disambiguate if needed
-                pairs = [(i, n) for i, n in enumerate(ordered_names)]
-                pairs = self._dedupe_team_names(pairs)
-                self.team_list = pairs
+                    name_to_ptrs.setdefault(name, []).append(ptr)
+                # For names that map to multiple pointers (i.e. still
+                # identical after attempting to include the year), append an
+                # index to disambiguate them.  This ensures that classic
+                # teams with identical names remain separate.  The ordering
+                # of indices is deterministic to maintain stable names
+                # between scans.
+                for name, ptrs in name_to_ptrs.items():
+                    if len(ptrs) > 1:
+                        seen: set[int] = set()
+                        unique_ptrs: list[int] = []
+                        for ptr in ptrs:
+                            if ptr not in seen:
+                                seen.add(ptr)
+                                unique_ptrs.append(ptr)
+                        for suffix_idx, ptr in enumerate(unique_ptrs):
+                            ptr_to_name[ptr] = f"{name} [{suffix_idx}]"
+                # Update each player's team label based on the pointer
+                for p in players:
+                    p.team = ptr_to_name[p.team_ptr]
+                unique_names = set(ptr_to_name.values())
+                # Apply the 'Team ' sorting heuristic.  Names are unique here,
+                # so the decorated (flag, name) tuples sort without ties and
+                # the set needs no pre-sort.
+                decorated = [
+                    (1 if n.strip()[:5].lower() == "team " else 0, n)
+                    for n in unique_names
+                ]
+                decorated.sort()
+                # Number the names as (index, name) pairs in the same pass.
+                # They come from a set, so there are no duplicates for
+                # ``_dedupe_team_names`` to disambiguate.
+                self._set_team_list([(i, n) for i, (_, n) in enumerate(decorated)])
                 self.players = players
                 self.fallback_players = True
                 self._build_name_index_map()
@@ -2292,18 +3482,34 @@ class PlayerDataModel:
 
         This method should be invoked whenever ``self.players`` is assigned a new
         list (e.g. after scanning).  It constructs a
-        dictionary mapping each player's lower‑cased "first last" name to a
-        list of indices.  Using this mapping allows for O(1) lookups of
+        dictionary mapping each player's "first last" name, normalized by
+        ``_player_name_key``, to a list of indices.  Using this mapping allows for O(1) lookups of
         players by name instead of scanning the entire ``self.players`` list.
+        The same pass groups players by ``team`` for ``get_players_by_team``,
+        so call it again after reassigning player teams.
         """
-        self.name_index_map.clear()
+        index_map = self.name_index_map
+        index_map.clear()
+        get = index_map.get
+        name_key = _player_name_key
+        by_team: Dict[str, list[Player]] = {}
+        self._players_by_team = by_team
         for p in self.players:
-            first = p.first_name.strip().lower()
-            last = p.last_name.strip().lower()
-            if not first and not last:
+            bucket = by_team.get(p.team)
+            if bucket is None:
+                by_team[p.team] = [p]
+            else:
+                bucket.append(p)
+            # Normalizing the joined name gives the same key as normalizing
+            # each part, with one call instead of two.
+            key = name_key(f"{p.first_name} {p.last_name}")
+            if not key:
                 continue
-            key = f"{first} {last}".strip()
-            self.name_index_map.setdefault(key, []).append(p.index)
+            hits = get(key)
+            if hits is None:
+                index_map[key] = [p.index]
+            else:
+                hits.append(p.index)
 
     # -----------------------------------------------------------------
     # Low‑level field access for advanced editing
@@ -2332,7 +3538,7 @@ class PlayerDataModel:
         """
         try:
             # Ensure process is open
-            if not self.mem.open_process():
+            if not self.mem.ensure_open():
                 return None
             base = self._resolve_player_table_base()
             if base is None:
@@ -2342,14 +3548,60 @@ class PlayerDataModel:
             # Determine number of bytes needed
             bits_needed = start_bit + length
             bytes_needed = (bits_needed + 7) // 8
-            raw = self.mem.read_bytes(addr, bytes_needed)
-            val = int.from_bytes(raw, "little")
-            val >>= start_bit
+            if 0 < bytes_needed <= 8:
+                # Common case: the field fits in one 64‑bit word
+                val = self.mem.read_uint(addr, bytes_needed)
+            else:
+                raw = self.mem.read_bytes(addr, bytes_needed)
+                val = int.from_bytes(raw, "little")
             mask = (1 << length) - 1
-            return val & mask
+            return (val >> start_bit) & mask
         except Exception:
             return None
 
+    def get_field_values(
+        self, player_index: int, specs: list[tuple[int, int, int]]
+    ) -> list[int | None]:
+        """
+        Retrieve several bit fields from a player's record at once.
+
+        Rather than issuing one memory read per field (as repeated calls to
+        ``get_field_value`` would), the smallest byte range covering every
+        requested field is read once and the fields are decoded from that
+        copy with ``decode_bitfields``.
+
+        Parameters
+        ----------
+        player_index : int
+            Index of the player within the player table.
+        specs : list[tuple[int, int, int]]
+            ``(offset, start_bit, length)`` tuples, one per field.
+
+        Returns
+        -------
+        list[int | None]
+            The decoded values in the order of ``specs``.  Every entry is
+            ``None`` if the record cannot be read.
+        """
+        if not specs:
+            return []
+        try:
+            if not self.mem.ensure_open():
+                return [None] * len(specs)
+            base = self._resolve_player_table_base()
+            if base is None:
+                return [None] * len(specs)
+            lo = min(offset for offset, _, _ in specs)
+            hi = max(
+                offset + (start_bit + length + 7) // 8
+                for offset, start_bit, length in specs
+            )
+            addr = base + player_index * PLAYER_STRIDE + lo
+            raw = self.mem.read_bytes(addr, hi - lo)
+            return decode_bitfields(raw, specs, lo)
+        except Exception:
+            return [None] * len(specs)
+
     def set_field_value(
         self, player_index: int, offset: int, start_bit: int, length: int, value: int
     ) -> bool:
@@ -2376,31 +3628,160 @@ class PlayerDataModel:
             True on success, False on failure.
         """
         try:
-            if not self.mem.open_process():
+            if not self.mem.ensure_open():
+                return False
+            base = self._resolve_player_table_base()
+            if base is None:
+                return False
+            # Clamp value to valid range
+            max_val = (1 << length) - 1
+            value = max(0, min(max_val, int(value)))
+            addr = base + player_index * PLAYER_STRIDE + offset
+            bits_needed = start_bit + length
+            bytes_needed = (bits_needed + 7) // 8
+            mask = ((1 << length) - 1) << start_bit
+            if 0 < bytes_needed <= 8:
+                # Common case: the field fits in one 64‑bit word, which is
+                # read and written back without any intermediate bytes
+                current = self.mem.read_uint(addr, bytes_needed)
+                current = (current & ~mask) | ((value << start_bit) & mask)
+                self.mem.write_uint(addr, current, bytes_needed)
+                return True
+            current = int.from_bytes(self.mem.read_bytes(addr, bytes_needed), "little")
+            current &= ~mask
+            current |= (value << start_bit) & mask
+            new_bytes = current.to_bytes(bytes_needed, "little")
+            self.mem.write_bytes(addr, new_bytes)
+            return True
+        except Exception:
+            return False
+
+    def set_field_values_bulk(
+        self, player_index: int, updates: list[tuple[int, int, int, int]]
+    ) -> bool:
+        """
+        Write several bit fields of one player's record at once.
+
+        Repeated ``set_field_value`` calls read and write the bytes of every
+        field separately, although neighbouring fields usually share bytes.
+        Here the byte range covering all fields is read once, the edits are
+        applied in order to that copy, and each run of contiguous modified
+        bytes is written back with a single ``WriteProcessMemory`` call.
+        Bytes between runs are never written.
+
+        Parameters
+        ----------
+        player_index : int
+            Index of the player within the player table.
+        updates : list[tuple[int, int, int, int]]
+            ``(offset, start_bit, length, value)`` tuples, one per field.
+            Values are clamped as in ``set_field_value``; if fields overlap,
+            later entries win.
+
+        Returns
+        -------
+        bool
+            True if at least one field was written, False otherwise.
+        """
+        if not updates:
+            return False
+        try:
+            if not self.mem.ensure_open():
                 return False
             base = self._resolve_player_table_base()
             if base is None:
                 return False
-            # Clamp value to valid range
-            max_val = (1 << length) - 1
-            value = max(0, min(max_val, int(value)))
-            addr = base + player_index * PLAYER_STRIDE + offset
-            bits_needed = start_bit + length
-            bytes_needed = (bits_needed + 7) // 8
-            data = bytearray(self.mem.read_bytes(addr, bytes_needed))
-            current = int.from_bytes(data, "little")
-            mask = ((1 << length) - 1) << start_bit
-            current &= ~mask
-            current |= (value << start_bit) & mask
-            new_bytes = current.to_bytes(bytes_needed, "little")
-            self.mem.write_bytes(addr, new_bytes)
-            return True
+            lo, size, fields, runs = _bitfield_write_plan(
+                tuple((offset, start_bit, length) for offset, start_bit, length, _ in updates)
+            )
+            addr = base + player_index * PLAYER_STRIDE + lo
+            # Read straight into the buffer that is edited and written back
+            data = bytearray(size)
+            self.mem.read_block(addr, data)
         except Exception:
             return False
+        from_bytes = int.from_bytes
+        for (start, end, max_value, shift, clear_mask), update in zip(fields, updates):
+            # Clamping keeps the shifted value inside the field's bits, so
+            # no mask is needed when OR-ing it in.
+            value = max(0, min(max_value, int(update[3])))
+            word = (from_bytes(data[start:end], "little") & clear_mask) | (value << shift)
+            data[start:end] = word.to_bytes(end - start, "little")
+        written = False
+        view = memoryview(data)
+        for start, end in runs:
+            try:
+                self.mem.write_bytes(addr + start, view[start:end])
+                written = True
+            except Exception:
+                continue
+        return written
 
     # -----------------------------------------------------------------
     # Pointer resolution helpers
     # -----------------------------------------------------------------
+    def _chain_root(self, rva: int) -> int | None:
+        """Return the pointer stored at ``module_base + rva``, or ``None``.
+
+        Root reads are shared between the player and team resolvers.  When a
+        root is first needed, every other chain root within
+        ``CHAIN_ROOT_READ_SPAN`` of it is fetched by the same
+        ReadProcessMemory call.  If that read fails, the root is read on its
+        own.
+        """
+        roots = self._chain_root_values
+        if roots is None:
+            roots = self._chain_root_values = {}
+        if rva in roots:
+            return roots[rva]
+        group = sorted(
+            r
+            for r in {c[0] for c in PLAYER_PTR_CHAINS} | {c[0] for c in TEAM_PTR_CHAINS}
+            if rva <= r and r + 8 - rva <= CHAIN_ROOT_READ_SPAN and r not in roots
+        )
+        if rva not in group:
+            group.insert(0, rva)
+        base = self.mem.base_addr
+        try:
+            data = self.mem.read_bytes(base + rva, group[-1] + 8 - rva)
+            for r in group:
+                roots[r] = struct.unpack_from("<Q", data, r - rva)[0]
+        except Exception:
+            try:
+                roots[rva] = self.mem.read_uint64(base + rva)
+            except Exception:
+                roots[rva] = None
+        return roots[rva]
+
+    def _sync_resolver_cache(self) -> None:
+        """Forget resolved pointers if the game process has changed.
+
+        The cached table bases and chain roots are only valid for the process
+        instance they were read from.  If the game was restarted and reopened
+        (new PID, handle or module base) without a ``refresh_players`` call,
+        they are dropped so the next lookup resolves the chains again.
+        """
+        key = (self.mem.pid, self.mem.hproc, self.mem.base_addr)
+        if key != self._resolver_key:
+            self._resolver_key = key
+            self._resolved_player_base = None
+            self._resolved_team_base = None
+            self._chain_root_values = None
+            self._team_name_by_ptr.clear()
+
+    def _record_has_name(self, player_addr: int) -> bool:
+        """Return True if the player record at ``player_addr`` has a name.
+
+        Raises if the record cannot be read.
+        """
+        last_raw, first_raw, _, _ = _unpack_player_record(
+            self.mem.read_player_record(player_addr), 0
+        )
+        return bool(
+            _decode_wstring(last_raw, 0, NAME_MAX_CHARS).strip()
+            or _decode_wstring(first_raw, 0, NAME_MAX_CHARS).strip()
+        )
+
     def _resolve_player_table_base(self) -> int | None:
         """Resolve and cache the base pointer of the player table.
 
@@ -2431,14 +3812,16 @@ class PlayerDataModel:
         address is found.
         """
         # Return cached result if present
+        self._sync_resolver_cache()
         if self._resolved_player_base is not None:
             return self._resolved_player_base
         if not self.mem.hproc or self.mem.base_addr is None:
             return None
         for rva_off, final_off, extra_deref in PLAYER_PTR_CHAINS:
             try:
-                p0_addr = self.mem.base_addr + rva_off
-                p = self.mem.read_uint64(p0_addr)
+                p = self._chain_root(rva_off)
+                if p is None:
+                    continue
                 # Some patches require an extra dereference here.  For
                 # example, ``[[base+rva]]`` rather than just
                 # ``[base+rva]``.  Only perform this when requested.
@@ -2447,13 +3830,7 @@ class PlayerDataModel:
                 # Apply the final offset to arrive at the table base
                 table_base = p + final_off
                 # Sanity check: read the first player's names
-                ln = self.mem.read_wstring(
-                    table_base + OFF_LAST_NAME, NAME_MAX_CHARS
-                ).strip()
-                fn = self.mem.read_wstring(
-                    table_base + OFF_FIRST_NAME, NAME_MAX_CHARS
-                ).strip()
-                if ln or fn:
+                if self._record_has_name(table_base):
                     self._resolved_player_base = table_base
                     return table_base
             except Exception:
@@ -2461,17 +3838,14 @@ class PlayerDataModel:
         # Fallback: use static RVA if defined
         try:
             fallback_addr = self.mem.base_addr + PLAYER_TABLE_RVA
-            ln = self.mem.read_wstring(
-                fallback_addr + OFF_LAST_NAME, NAME_MAX_CHARS
-            ).strip()
-            fn = self.mem.read_wstring(
-                fallback_addr + OFF_FIRST_NAME, NAME_MAX_CHARS
-            ).strip()
-            if ln or fn:
+            if self._record_has_name(fallback_addr):
                 self._resolved_player_base = fallback_addr
                 return fallback_addr
         except Exception:
             pass
+        # Re-read the roots on the next attempt; the game may still be
+        # setting up its tables.
+        self._chain_root_values = None
         return None
 
     def _resolve_team_base_ptr(self) -> int | None:
@@ -2496,14 +3870,16 @@ class PlayerDataModel:
         and returned.  If no chains produce a valid name, ``None``
         is returned.
         """
+        self._sync_resolver_cache()
         if self._resolved_team_base is not None:
             return self._resolved_team_base
         if not self.mem.hproc or self.mem.base_addr is None:
             return None
         for rva_off, final_off, extra_deref in TEAM_PTR_CHAINS:
             try:
-                p0_addr = self.mem.base_addr + rva_off
-                p = self.mem.read_uint64(p0_addr)
+                p = self._chain_root(rva_off)
+                if p is None:
+                    continue
                 if extra_deref:
                     p = self.mem.read_uint64(p)
                 team_base = p + final_off
@@ -2514,14 +3890,14 @@ class PlayerDataModel:
                 # printable and contain at least two letters.
                 name = self.mem.read_wstring(
                     team_base + TEAM_NAME_OFFSET, TEAM_NAME_LENGTH
-                ).strip()
-                if name:
-                    # if the string is printable and has two letters, accept
-                    if name.isprintable() and sum(ch.isalpha() for ch in name) >= 2:
-                        self._resolved_team_base = team_base
-                        return team_base
+                )
+                # if the string is printable and has two letters, accept
+                if self._is_printable_ascii(name):
+                    self._resolved_team_base = team_base
+                    return team_base
             except Exception:
                 continue
+        self._chain_root_values = None
         return None
 
     def get_teams(self) -> list[str]:
@@ -2544,46 +3920,40 @@ class PlayerDataModel:
         Within each category the original order is preserved.
         """
         if self.team_list:
-            free: list[str] = []
-            draft: list[str] = []
-            base: list[str] = []
-            historic: list[str] = []
-            all_time: list[str] = []
-            g_league: list[str] = []
-            for idx, name in self.team_list:
-                ln = name.lower()
-                t = self.team_types.get(idx, 0)
-                if "free" in ln:
-                    free.append(name)
-                elif "draft" in ln:
-                    draft.append(name)
-                elif t in (1, 24):
-                    historic.append(name)
-                elif t == 25 or "all time" in ln or "all-time" in ln:
-                    all_time.append(name)
-                elif "gleague" in ln or "g league" in ln or "g-league" in ln:
-                    g_league.append(name)
-                else:
-                    base.append(name)
-            return free + draft + base + historic + all_time + g_league
-        # Offline fallback: derive categories from player team names
-        names_set = {p.team for p in self.players}
-        names = list(names_set)
-        lower_names = [n.lower() for n in names]
-        free = [names[i] for i, ln in enumerate(lower_names) if "free" in ln]
-        draft = [names[i] for i, ln in enumerate(lower_names) if "draft" in ln]
-        all_time = [
-            names[i]
-            for i, ln in enumerate(lower_names)
-            if "all time" in ln or "all-time" in ln
-        ]
-        g_league = [
-            names[i]
-            for i, ln in enumerate(lower_names)
-            if "gleague" in ln or "g league" in ln or "g-league" in ln
-        ]
-        assigned = set(free + draft + all_time + g_league)
-        base = [n for n in names if n not in assigned]
+            # Groups were assigned when the team list was set; see
+            # ``_recompute_team_categories``.
+            groups: list[list[str]] = [[], [], [], [], [], []]
+            for (_, name), category in zip(self.team_list, self._team_categories):
+                groups[category].append(name)
+            return [name for group in groups for name in group]
+        # Offline fallback: derive categories from player team names.  The
+        # distinct names are the keys of the team grouping built alongside
+        # the name index, so players are not walked again here.  Each name
+        # is lower-cased and tested once; a name matching several keywords
+        # is listed under each of them, and names matching none are
+        # standard teams.
+        free = []
+        draft = []
+        base = []
+        all_time = []
+        g_league = []
+        for name in self._players_by_team:
+            ln = name.lower()
+            assigned = False
+            if "free" in ln:
+                free.append(name)
+                assigned = True
+            if "draft" in ln:
+                draft.append(name)
+                assigned = True
+            if "all time" in ln or "all-time" in ln:
+                all_time.append(name)
+                assigned = True
+            if "gleague" in ln or "g league" in ln or "g-league" in ln:
+                g_league.append(name)
+                assigned = True
+            if not assigned:
+                base.append(name)
         return free + draft + base + all_time + g_league
 
     def get_players_by_team(self, team: str) -> list[Player]:
@@ -2593,19 +3963,17 @@ class PlayerDataModel:
         mapping to look up players dynamically.  Otherwise, filter
         preloaded players (fallback mode).
         """
-        if self.team_list:
-            if self.fallback_players:
-                return [p for p in self.players if p.team == team]
-            for idx, name in self.team_list:
-                if name == team:
-                    return self.scan_team_players(idx)
-            return []
-        return [p for p in self.players if p.team == team]
+        if self.team_list and not self.fallback_players:
+            idx = self._team_name_to_idx.get(team)
+            return self.scan_team_players(idx) if idx is not None else []
+        # Copy the bucket so callers cannot mutate the cached grouping.
+        return list(self._players_by_team.get(team, ()))
 
     def update_player(self, player: Player) -> None:
         """Write changes to a player back to memory if connected."""
         if not self.mem.hproc or self.mem.base_addr is None:
             return
+        self._refreshed_at = None
         # Resolve dynamic player table base pointer
         table_base = self._resolve_player_table_base()
         if table_base is None:
@@ -2638,6 +4006,7 @@ class PlayerDataModel:
         """
         if not self.mem.hproc or self.mem.base_addr is None:
             return False
+        self._refreshed_at = None
         # Resolve dynamic player table base pointer
         table_base = self._resolve_player_table_base()
         if table_base is None:
@@ -2652,31 +4021,37 @@ class PlayerDataModel:
             return False
         src_addr = table_base + src_index * PLAYER_STRIDE
         dst_addr = table_base + dst_index * PLAYER_STRIDE
+        spans: list[tuple[int, int]] = []
+        for cat in categories:
+            c = cat.lower()
+            if c == "full":
+                # Copy entire player record
+                spans.append((0, PLAYER_STRIDE))
+            elif c in PLAYER_COPY_BLOCKS:
+                spans.append(PLAYER_COPY_BLOCKS[c])
+        if not spans:
+            return True
+        # Merge overlapping and adjacent blocks into disjoint extents so each
+        # extent is written with a single call; bytes between selected blocks
+        # are still left untouched.
+        extents: list[list[int]] = []
+        for off, length in sorted(spans):
+            if extents and off <= extents[-1][1]:
+                extents[-1][1] = max(extents[-1][1], off + length)
+            else:
+                extents.append([off, off + length])
+        # Read the source once, covering every selected block (at most one
+        # record), into a scratch buffer kept for later copies, then write
+        # each extent back out of that buffer.
+        lo = extents[0][0]
+        hi = max(end for _, end in extents)
+        if self._copy_buf is None or len(self._copy_buf) < hi - lo:
+            self._copy_buf = bytearray(max(hi - lo, PLAYER_STRIDE))
+        data = memoryview(self._copy_buf)[: hi - lo]
         try:
-            for cat in categories:
-                c = cat.lower()
-                if c == "appearance":
-                    data = self.mem.read_bytes(
-                        src_addr + OFF_APPEARANCE, LEN_APPEARANCE
-                    )
-                    self.mem.write_bytes(dst_addr + OFF_APPEARANCE, data)
-                elif c == "attributes":
-                    data = self.mem.read_bytes(
-                        src_addr + OFF_ATTRIBUTES, LEN_ATTRIBUTES
-                    )
-                    self.mem.write_bytes(dst_addr + OFF_ATTRIBUTES, data)
-                elif c == "tendencies":
-                    data = self.mem.read_bytes(
-                        src_addr + OFF_TENDENCIES, LEN_TENDENCIES
-                    )
-                    self.mem.write_bytes(dst_addr + OFF_TENDENCIES, data)
-                elif c == "badges":
-                    data = self.mem.read_bytes(src_addr + OFF_BADGES, LEN_BADGES)
-                    self.mem.write_bytes(dst_addr + OFF_BADGES, data)
-                elif c == "full":
-                    # Copy entire player record
-                    data = self.mem.read_bytes(src_addr, PLAYER_STRIDE)
-                    self.mem.write_bytes(dst_addr, data)
+            self.mem.read_block(src_addr + lo, data)
+            for start, end in extents:
+                self.mem.write_bytes(dst_addr + start, data[start - lo : end - lo])
             return True
         except Exception:
             return False
@@ -2704,12 +4079,32 @@ class PlayerEditorApp(tk.Tk):
         self.current_players: list[Player] = []
         self.filtered_player_indices: list[int] = []
         self.player_search_var = tk.StringVar()
+        # Search filter state.  Keystrokes are coalesced through a pending
+        # ``after`` callback, and the last applied search together with the
+        # list it was applied to lets a search that extends the previous one
+        # re-check only the rows still shown.  Lower‑cased names are cached
+        # per ``current_players`` list.
+        self._filter_pending: str | None = None
+        self._filter_source: list[Player] | None = None
+        self._filter_names: list[str] = []
+        self._last_search = ""
+        # Import dialogs, created on first use and reused (see
+        # ``_ask_import_categories`` and ``_show_loading_window``)
+        self._category_dialog: CategorySelectionDialog | None = None
+        self._loading_win: tk.Toplevel | None = None
+        self._loading_label: tk.Label | None = None
 
         # Build UI elements
         self._build_sidebar()
         self._build_home_screen()
         self._build_players_screen()
         self._build_teams_screen()
+        # Screens shown one at a time by ``_show_screen``
+        self._screens: Dict[str, tk.Frame] = {
+            "home": self.home_frame,
+            "players": self.players_frame,
+            "teams": self.teams_frame,
+        }
         # Show home by default
         self.show_home()
 
@@ -2837,6 +4232,40 @@ class PlayerEditorApp(tk.Tk):
     # ---------------------------------------------------------------------
     # Home screen
     # ---------------------------------------------------------------------
+    @staticmethod
+    def _load_home_logo(logo_path: str, Image, ImageTk):
+        """Return the home screen logo scaled to 250x250, or ``None``.
+
+        The Lanczos resize is the slowest part of building the home screen,
+        so its result is saved next to the logo as ``homepage_logo@250.png``
+        and later launches load that file with ``tk.PhotoImage`` directly,
+        without PIL.  The cache is stamped with the logo's modification time
+        and rebuilt whenever the two differ, so replacing the logo with an
+        older file (e.g. one extracted from an archive) is noticed too.  If
+        the directory is read-only the resized image is simply not cached.
+        """
+        root, ext = os.path.splitext(logo_path)
+        cache_path = f"{root}@250{ext}"
+        try:
+            logo_stat = os.stat(logo_path)
+            if os.stat(cache_path).st_mtime_ns == logo_stat.st_mtime_ns:
+                return tk.PhotoImage(file=cache_path)
+        except (OSError, tk.TclError):
+            pass
+        if not (Image and ImageTk):
+            return None
+        img = Image.open(logo_path)
+        img = img.resize((250, 250), getattr(Image, "LANCZOS", 1))
+        try:
+            img.save(cache_path, optimize=True)
+            # Only a complete cache file gets the logo's time stamp
+            os.utime(
+                cache_path, ns=(logo_stat.st_atime_ns, logo_stat.st_mtime_ns)
+            )
+        except Exception:
+            pass
+        return ImageTk.PhotoImage(img)
+
     def _build_home_screen(self):
         self.home_frame = tk.Frame(self, bg="#CAD2C5")
         # Title
@@ -2857,11 +4286,10 @@ class PlayerEditorApp(tk.Tk):
             ]
 
             logo_path = next((p for p in logo_candidates if os.path.isfile(p)), None)
-            if logo_path and Image and ImageTk:
-                img = Image.open(logo_path)
-                img = img.resize((250, 250), getattr(Image, "LANCZOS", 1))
-                self.logo_img = ImageTk.PhotoImage(img)
-                tk.Label(self.home_frame, image=self.logo_img, bg="#CAD2C5").pack(pady=(20, 10))
+            if logo_path:
+                self.logo_img = self._load_home_logo(logo_path, Image, ImageTk)
+                if self.logo_img is not None:
+                    tk.Label(self.home_frame, image=self.logo_img, bg="#CAD2C5").pack(pady=(20, 10))
         except Exception as e:
             print("Logo load failed:", e)
 
@@ -2945,9 +4373,9 @@ class PlayerEditorApp(tk.Tk):
 
         self.search_entry.bind("<FocusIn>", _on_search_focus_in)
         self.search_entry.bind("<FocusOut>", _on_search_focus_out)
-        # When text is entered, filter the player list
+        # When text is entered, filter the player list once typing pauses
         self.player_search_var.trace_add(
-            "write", lambda *args: self._filter_player_list()
+            "write", lambda *args: self._schedule_player_filter()
         )
         self.scan_status_label = tk.Label(
             top, text="", font=("Segoe UI", 10, "italic"), bg="#F5F5F5", fg="#52796F"
@@ -3071,42 +4499,37 @@ class PlayerEditorApp(tk.Tk):
     # ---------------------------------------------------------------------
     # Navigation methods
     # ---------------------------------------------------------------------
+    def _show_screen(self, name: str) -> None:
+        """Pack the screen ``name`` and unpack whichever other one is shown.
+
+        Only screens currently managed by ``pack`` are forgotten and the
+        target is only packed if it is not already, so switching screens
+        costs at most one forget and one pack (one relayout each).
+        """
+        target = self._screens[name]
+        for frame in self._screens.values():
+            if frame is not target and frame.winfo_manager():
+                frame.pack_forget()
+        if not target.winfo_manager():
+            target.pack(fill=tk.BOTH, expand=True)
+
     def show_home(self):
         """
         Display the Home screen and hide any other visible panes."""
-        try:
-            self.players_frame.pack_forget()
-        except Exception:
-            pass
-        try:
-            self.teams_frame.pack_forget()
-        except Exception:
-            pass
-        # Show the home screen
-        self.home_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen("home")
         self._update_status()
 
     def show_players(self):
         """
         Display the Players screen and hide other panes."""
-        try:
-            self.home_frame.pack_forget()
-        except Exception:
-            pass
-        try:
-            self.teams_frame.pack_forget()
-        except Exception:
-            pass
-        # Show the players screen
-        self.players_frame.pack(fill=tk.BOTH, expand=True)
-        # Kick off a background scan to load players and teams
-        self._start_scan()
+        self._show_screen("players")
+        # Kick off a background scan to load players and teams; a scan that
+        # finished moments ago is reused
+        self._start_scan(force=False)
 
     def show_teams(self):
         """Display the Teams screen and start scanning if necessary."""
-        self.home_frame.pack_forget()
-        self.players_frame.pack_forget()
-        self.teams_frame.pack(fill=tk.BOTH, expand=True)
+        self._show_screen("teams")
         # Kick off a scan if we don't have team names yet
         if not self.model.get_teams():
             # Use the same scanning logic as players
@@ -3131,7 +4554,7 @@ class PlayerEditorApp(tk.Tk):
         """Open the Randomizer window for mass randomizing player values."""
         try:
             # Ensure we have up-to-date player and team lists
-            self.model.refresh_players()
+            self.model.refresh_players_if_stale()
         except Exception:
             pass
         # Launch the randomizer window.  The RandomizerWindow class is
@@ -3143,7 +4566,7 @@ class PlayerEditorApp(tk.Tk):
         """Open the Team Shuffle window to shuffle players across selected teams."""
         try:
             # Refresh player list to ensure team assignments are current
-            self.model.refresh_players()
+            self.model.refresh_players_if_stale()
         except Exception:
             pass
         TeamShuffleWindow(self, self.model)
@@ -3162,7 +4585,7 @@ class PlayerEditorApp(tk.Tk):
         """
         try:
             # Refresh player and team lists; ignore errors if scanning fails
-            self.model.refresh_players()
+            self.model.refresh_players_if_stale()
         except Exception:
             pass
         # Launch the batch edit window.  Any exceptions raised during
@@ -3177,6 +4600,68 @@ class PlayerEditorApp(tk.Tk):
             )
             traceback.print_exc()
 
+    def _ask_import_categories(self, categories: list[str]) -> list[str] | None:
+        """Ask which ``categories`` to import; ``None`` if cancelled.
+
+        The imports always offer the same categories, so one
+        ``CategorySelectionDialog`` is created on first use and shown again
+        (with every box re-checked) for later imports.
+        """
+        dlg = self._category_dialog
+        try:
+            if (
+                dlg is None
+                or not dlg.winfo_exists()
+                or list(dlg.var_map) != categories
+            ):
+                if dlg is not None:
+                    dlg.destroy()
+                dlg = self._category_dialog = CategorySelectionDialog(self, categories)
+            return dlg.ask()
+        except Exception:
+            self._category_dialog = None
+            return None
+
+    def _show_loading_window(self) -> tuple[tk.Toplevel, tk.Label]:
+        """Show the modal "Loading data..." window used by the imports.
+
+        The imports read and write player records on a worker thread, so the
+        window holds a grab (and cannot be closed) until
+        ``_hide_loading_window``; nothing else in the editor can touch the
+        roster meanwhile.  The window is created once and hidden with
+        ``withdraw`` when an import finishes.
+        """
+        win = self._loading_win
+        if win is None or not win.winfo_exists():
+            win = self._loading_win = tk.Toplevel(self)
+            win.title("Loading")
+            win.geometry("350x120")
+            win.resizable(False, False)
+            win.transient(self)
+            # Closing the window would not stop the import; ignore it
+            win.protocol("WM_DELETE_WINDOW", lambda: None)
+            self._loading_label = tk.Label(
+                win, wraplength=320, justify="left"
+            )
+            self._loading_label.pack(padx=20, pady=20)
+        else:
+            win.deiconify()
+        self._loading_label.config(
+            text="Loading data... Please wait and do not click the updater."
+        )
+        win.update_idletasks()
+        win.grab_set()
+        return win, self._loading_label
+
+    @staticmethod
+    def _hide_loading_window(win: tk.Toplevel) -> None:
+        """Release the grab of the loading window and hide it."""
+        try:
+            win.grab_release()
+            win.withdraw()
+        except Exception:
+            pass
+
     def _open_2kcoy(self) -> None:
         """
         Automatically import player ratings from a fixed Google Sheet and apply
@@ -3187,9 +4672,15 @@ class PlayerEditorApp(tk.Tk):
         manually.  A summary of updates and any players not found is
         displayed at the end.
         """
+        # A roster scan or another import is still running in the background
+        if self.scanning:
+            messagebox.showinfo(
+                "2K COY Import", "Please wait for the current scan or import to finish."
+            )
+            return
         # Refresh players to ensure we have up-to-date indices
         try:
-            self.model.refresh_players()
+            self.model.refresh_players_if_stale()
         except Exception:
             pass
         # Require the game to be running
@@ -3207,84 +4698,98 @@ class PlayerEditorApp(tk.Tk):
         # boxes, no import is performed.
         # ------------------------------------------------------------------
         categories_to_ask = ["Attributes", "Tendencies", "Durability"]
-        try:
-            dlg = CategorySelectionDialog(self, categories_to_ask)
-            # Wait for the dialog to close before proceeding
-            self.wait_window(dlg)
-            selected_categories = dlg.selected
-        except Exception:
-            selected_categories = None
+        selected_categories = self._ask_import_categories(categories_to_ask)
         # If the user cancelled (None) or selected nothing, abort
         if not selected_categories:
             return
 
         # Show a loading dialog to discourage clicking during processing
-        loading_win = tk.Toplevel(self)
-        loading_win.title("Loading")
-        loading_win.geometry("350x120")
-        loading_win.resizable(False, False)
-        tk.Label(
-            loading_win,
-            text="Loading data... Please wait and do not click the updater.",
-            wraplength=320,
-            justify="left",
-        ).pack(padx=20, pady=20)
-        loading_win.update_idletasks()
-
-        # Determine whether to auto-download or prompt for files
-        auto_download = bool(COY_SHEET_ID)
-        file_map: dict[str, str] = {}
-        not_found: set[str] = set()
+        loading_win, loading_label = self._show_loading_window()
+
+        # Determine whether to auto-download or prompt for files.  Either way
+        # each table is parsed exactly once into ``rows_map``; the missing
+        # names, the Attributes pool and the import itself all use those rows.
+        # Downloading, parsing and writing run on worker threads so that the
+        # loading dialog keeps repainting; only the file dialogs and the
+        # summary run on the Tk thread.  ``scanning`` stays set until the
+        # import finishes so no roster scan runs against it.
+        self.scanning = True
+        if COY_SHEET_ID:
+            # Fetch the configured sheets for the selected categories
+            wanted = [
+                (cat, sheet_name)
+                for cat, sheet_name in COY_SHEET_TABS.items()
+                if cat in selected_categories
+            ]
+            threading.Thread(
+                target=self._coy_fetch_thread,
+                args=(
+                    wanted,
+                    categories_to_ask,
+                    selected_categories,
+                    loading_win,
+                    loading_label,
+                ),
+                daemon=True,
+            ).start()
+        else:
+            self._coy_select_files(
+                {}, categories_to_ask, selected_categories, loading_win
+            )
 
-        if auto_download:
-            # Attempt to fetch each configured sheet for the selected categories
-            for cat, sheet_name in COY_SHEET_TABS.items():
-                # Skip categories the user did not select
-                if cat not in selected_categories:
-                    continue
-                try:
-                    # Build CSV export URL for the given sheet
-                    url = (
-                        f"https://docs.google.com/spreadsheets/d/{COY_SHEET_ID}/"
-                        f"gviz/tq?tqx=out:csv&sheet={urllib.parse.quote(sheet_name)}"
-                    )
-                    with urllib.request.urlopen(url, timeout=30) as resp:
-                        csv_text = resp.read().decode("utf-8")
-                except Exception:
-                    csv_text = ""
-                if not csv_text:
-                    # Could not fetch this sheet; skip it
-                    continue
-                # Write the CSV text to a temporary file
-                tmp = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".csv", mode="w", encoding="utf-8"
+    def _coy_fetch_thread(
+        self,
+        wanted: list[tuple[str, str]],
+        categories_to_ask: list[str],
+        selected_categories: list[str],
+        loading_win: tk.Toplevel,
+        loading_label: tk.Label,
+    ) -> None:
+        """Download the COY sheets in ``wanted`` (worker thread).
+
+        The downloads are network bound, so they run concurrently and the
+        total wait is roughly that of the slowest sheet.  Progress and the
+        next step of the import are handed back to the Tk thread.
+        """
+        fetched: dict[str, list[list[str]]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(wanted))) as pool:
+            futures = {
+                pool.submit(_fetch_coy_sheet, sheet_name): cat
+                for cat, sheet_name in wanted
+            }
+            # Report each sheet as it arrives
+            for done, fut in enumerate(as_completed(futures), 1):
+                fetched[futures[fut]] = fut.result()
+                text = (
+                    f"Downloaded {done} of {len(futures)} sheets... "
+                    "Please wait and do not click the updater."
                 )
-                tmp.write(csv_text)
-                tmp.close()
-                file_map[cat] = tmp.name
-                # Parse names to identify missing players
-                try:
-                    import csv as _csv
-
-                    reader = _csv.reader(io.StringIO(csv_text))
-                    # Skip header row if present
-                    next(reader, None)
-                    for row in reader:
-                        if not row:
-                            continue
-                        name = row[0].strip()
-                        if not name:
-                            continue
-                        idxs = self.model.find_player_indices_by_name(name)
-                        if not idxs:
-                            not_found.add(name)
-                except Exception:
-                    pass
-        # If no files were downloaded or auto-download disabled, prompt the user
-        if not file_map:
-            # Ask for the Attributes file
-            # For manual selection, prompt only for the categories chosen
+                self.after(0, lambda text=text: loading_label.config(text=text))
+        # Keep the configured category order for the import and summary;
+        # sheets that could not be fetched are skipped
+        rows_map = {cat: fetched[cat] for cat, _ in wanted if fetched.get(cat)}
+        self.after(
+            0,
+            lambda: self._coy_select_files(
+                rows_map, categories_to_ask, selected_categories, loading_win
+            ),
+        )
 
+    def _coy_select_files(
+        self,
+        rows_map: dict[str, list[list[str]]],
+        categories_to_ask: list[str],
+        selected_categories: list[str],
+        loading_win: tk.Toplevel,
+    ) -> None:
+        """Continue the COY import on the Tk thread after any downloads.
+
+        If nothing was downloaded (or auto-download is disabled) the user is
+        asked for one file per selected category; the tables are then read,
+        matched and imported on a worker thread.
+        """
+        paths: dict[str, str] = {}
+        if not rows_map:
             # Helper to open a file dialog for a given category
             def prompt_file(cat_name: str) -> str:
                 return filedialog.askopenfilename(
@@ -3296,98 +4801,96 @@ class PlayerEditorApp(tk.Tk):
                 )
 
             # For each selected category ask the user to select a file.  If
-            # they cancel on the first mandatory category (Attributes) then
-            # abort.
+            # they cancel any of them, abort.
             for cat in categories_to_ask:
                 if cat not in selected_categories:
                     continue
                 path = prompt_file(cat)
                 if not path:
                     # User cancelled; abort the entire import
-                    # Remove any previously selected files
-                    file_map.clear()
-                    return
-                file_map[cat] = path
-
-            # Collect names from selected files
-            def collect_missing_names(path: str) -> None:
-                import csv as _csv
-
-                if not path or not os.path.isfile(path):
+                    self.scanning = False
+                    self._hide_loading_window(loading_win)
                     return
-                try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                        sample = f.readline()
-                        delim = (
-                            "\t" if "\t" in sample else "," if "," in sample else ";"
-                        )
-                        f.seek(0)
-                        reader = _csv.reader(f, delimiter=delim)
-                        next(reader, None)  # skip header
-                        for row in reader:
-                            if not row:
-                                continue
-                            name = row[0].strip()
-                            if not name:
-                                continue
-                            idxs = self.model.find_player_indices_by_name(name)
-                            if not idxs:
-                                not_found.add(name)
-                except Exception:
-                    pass
-
-            for p in file_map.values():
-                collect_missing_names(p)
-
-        # Compute the size of the Attributes player pool (number of names in the
-        # attributes file).  We track this to inform the user if some
-        # players were not updated.  It is computed before imports so
-        # that ``import_all`` does not need to be changed.
-        attr_pool_size = 0
+                paths[cat] = path
+        threading.Thread(
+            target=self._coy_import_thread,
+            args=(rows_map, paths, loading_win),
+            daemon=True,
+        ).start()
+
+    def _coy_import_thread(
+        self,
+        rows_map: dict[str, list[list[str]]],
+        paths: dict[str, str],
+        loading_win: tk.Toplevel,
+    ) -> None:
+        """Read, match and import the COY tables (worker thread)."""
+        results: dict[str, int] = {}
+        not_found: set[str] = set()
         attr_names_set: set[str] = set()
-        if "Attributes" in file_map:
-            try:
-                import csv as _csv
+        error: str | None = None
+        try:
+            for cat, path in paths.items():
+                rows_map[cat] = self.model.read_table_rows(path)
+            # Collect the names of each table, noting any that are missing
+            # from the roster.  The names of the Attributes table also give
+            # the size of its player pool, used to tell the user if some
+            # players were not updated.  The same names usually appear in
+            # every table, so the tables' names are merged by name key first
+            # and each key is looked up in the roster's name index once.
+            all_names: dict[str, str] = {}
+            attr_keys: Iterable[str] = ()
+            for cat, rows in rows_map.items():
+                names = _table_player_names(rows)
+                if cat == "Attributes":
+                    attr_keys = names.keys()
+                all_names.update(names)
+            index = self.model.name_index_map
+            not_found = {
+                name for key, name in all_names.items() if key not in index
+            }
+            attr_names_set = {all_names[key] for key in attr_keys}
+            # Perform imports only for the selected categories
+            results = self.model.import_all_rows(rows_map)
+        except Exception as exc:
+            error = f"Import failed:\n{exc}"
+        self.after(
+            0,
+            lambda: self._finish_coy_import(
+                results, not_found, attr_names_set, error, loading_win
+            ),
+        )
 
-                path = file_map["Attributes"]
-                # Read the file (auto‑determine delimiter similar to import_table)
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    sample = f.readline()
-                    delim = "\t" if "\t" in sample else "," if "," in sample else ";"
-                    f.seek(0)
-                    reader = _csv.reader(f, delimiter=delim)
-                    rows = list(reader)
-                # Skip header and collect non‑blank names
-                for row in rows[1:]:
-                    if not row or not row[0].strip():
-                        continue
-                    attr_names_set.add(row[0].strip())
-                attr_pool_size = len(attr_names_set)
+    def _finish_coy_import(
+        self,
+        results: dict[str, int],
+        not_found: set[str],
+        attr_names_set: set[str],
+        error: str | None,
+        loading_win: tk.Toplevel,
+    ) -> None:
+        """Close the loading dialog and summarize the COY import (Tk thread)."""
+        # Refresh players to reflect changes.  This runs here, on the Tk
+        # thread, so it cannot overlap another refresh of the model.
+        if error is None:
+            try:
+                self.model.refresh_players()
             except Exception:
-                attr_pool_size = 0
-        # Perform imports only for the selected categories
-        results = self.model.import_all(file_map)
-        # Refresh players to reflect changes
-        try:
-            self.model.refresh_players()
-        except Exception:
-            pass
-        # Remove any temporary files created during auto-download
-        if auto_download:
-            for p in file_map.values():
-                try:
-                    if p and os.path.isfile(p):
-                        os.remove(p)
-                except Exception:
-                    pass
+                pass
+        self.scanning = False
+        # Hide the loading dialog before showing the summary
+        self._hide_loading_window(loading_win)
+        if error is not None:
+            messagebox.showerror("2K COY Import", error)
+            return
+        attr_pool_size = len(attr_names_set)
         # Build summary
         msg_lines = ["2K COY import completed."]
         # If any players were updated, list counts per category
         if results:
             msg_lines.append("\nPlayers updated:")
             for cat, cnt in results.items():
-                if file_map.get(cat):
-                    msg_lines.append(f"  {cat}: {cnt}")
+                msg_lines.append(f"  {cat}: {cnt}")
         # Compute number of attributes pool entries that were not updated
         if attr_pool_size:
             updated_attr = results.get("Attributes", 0)
@@ -3410,11 +4913,6 @@ class PlayerEditorApp(tk.Tk):
                 msg_lines.append(f"  {name}")
         else:
             msg_lines.append("\nAll players were found in the roster.")
-        # Destroy the loading dialog before showing the summary
-        try:
-            loading_win.destroy()
-        except Exception:
-            pass
         messagebox.showinfo("2K COY Import", "\n".join(msg_lines))
 
     def _open_load_excel(self) -> None:
@@ -3427,13 +4925,19 @@ class PlayerEditorApp(tk.Tk):
         Tendencies and/or Durability).  For each selected category, the
         corresponding sheet is extracted from the workbook (matching the
         category name if it exists, otherwise falling back to the first sheet).
-        The sheet is converted to a temporary CSV file and passed through
-        ``import_all`` for processing.  A modal loading dialog is displayed
+        The sheet is converted to CSV rows in memory and passed through
+        ``import_all_rows`` for processing.  A modal loading dialog is displayed
         during the import to discourage further clicks.
         """
+        # A roster scan or another import is still running in the background
+        if self.scanning:
+            messagebox.showinfo(
+                "Excel Import", "Please wait for the current scan or import to finish."
+            )
+            return
         # Refresh players to ensure we have up-to-date indices
         try:
-            self.model.refresh_players()
+            self.model.refresh_players_if_stale()
         except Exception:
             pass
         # Require the game to be running
@@ -3453,109 +4957,112 @@ class PlayerEditorApp(tk.Tk):
             return
         # Ask the user which categories to import
         categories_to_ask = ["Attributes", "Tendencies", "Durability"]
-        try:
-            dlg = CategorySelectionDialog(self, categories_to_ask)
-            self.wait_window(dlg)
-            selected_categories = dlg.selected
-        except Exception:
-            selected_categories = None
+        selected_categories = self._ask_import_categories(categories_to_ask)
         if not selected_categories:
             return
         # Show a loading dialog to discourage clicking during processing
-        loading_win = tk.Toplevel(self)
-        loading_win.title("Loading")
-        loading_win.geometry("350x120")
-        loading_win.resizable(False, False)
-        tk.Label(
-            loading_win,
-            text="Loading data... Please wait and do not click the updater.",
-            wraplength=320,
-            justify="left",
-        ).pack(padx=20, pady=20)
-        loading_win.update_idletasks()
-        file_map: dict[str, str] = {}
+        loading_win, _loading_label = self._show_loading_window()
+        # Reading the workbook and writing to memory run on a worker thread
+        # so the loading dialog keeps repainting; ``scanning`` stays set
+        # until the import finishes so no roster scan runs against it.
+        self.scanning = True
+        threading.Thread(
+            target=self._excel_import_thread,
+            args=(workbook_path, categories_to_ask, selected_categories, loading_win),
+            daemon=True,
+        ).start()
+
+    def _excel_import_thread(
+        self,
+        workbook_path: str,
+        categories_to_ask: list[str],
+        selected_categories: list[str],
+        loading_win: tk.Toplevel,
+    ) -> None:
+        """Read, match and import the sheets of an Excel workbook (worker thread)."""
+        rows_map: dict[str, list[list[str]]] = {}
         not_found: set[str] = set()
-        import pandas as _pd
-
-        # Helper to collect missing names from a DataFrame
-        def collect_missing_names_df(df) -> None:
-            for name in df.iloc[:, 0].astype(str).str.strip():
-                if not name:
-                    continue
-                idxs = self.model.find_player_indices_by_name(name)
-                if not idxs:
-                    not_found.add(name)
+        results: dict[str, int] = {}
+        error: str | None = None
 
+        # Names found on the sheets read, by name key; each key is looked up
+        # in the roster's name index once, however many sheets it is on.
+        all_names: dict[str, str] = {}
         try:
-            # Read the workbook once to obtain the list of sheet names
+            # Open the workbook once to obtain the list of sheet names
+            sheet_names, read_sheet, close_workbook = _open_excel_workbook(
+                workbook_path
+            )
+        except Exception:
+            error = f"Failed to read {os.path.basename(workbook_path)}"
+        else:
             try:
-                xls = _pd.ExcelFile(workbook_path)
-            except Exception:
-                messagebox.showerror(
-                    "Excel Import", f"Failed to read {os.path.basename(workbook_path)}"
-                )
-                loading_win.destroy()
-                return
-            for cat in categories_to_ask:
-                if cat not in selected_categories:
-                    continue
-                # Determine which sheet to read: prefer exact match of category name
-                sheet_to_use = None
-                for sheet_name in xls.sheet_names:
-                    if sheet_name.strip().lower() == cat.lower():
-                        sheet_to_use = sheet_name
-                        break
-                # If no exact match, use the first sheet
-                if sheet_to_use is None:
-                    sheet_to_use = xls.sheet_names[0] if xls.sheet_names else None
-                if sheet_to_use is None:
-                    continue
-                # Read the sheet into a DataFrame
-                try:
-                    df = xls.parse(sheet_to_use)
-                except Exception:
-                    # Attempt to read via pandas.read_excel fallback
+                # Index the sheets by normalized name once; iterating in
+                # reverse lets the first of several equally named sheets
+                # win, as a front-to-back search would.
+                sheet_lookup = {
+                    sheet_name.strip().lower(): sheet_name
+                    for sheet_name in reversed(sheet_names)
+                }
+                first_sheet = sheet_names[0] if sheet_names else None
+                for cat in categories_to_ask:
+                    if cat not in selected_categories:
+                        continue
+                    # Determine which sheet to read: prefer exact match of
+                    # category name, otherwise use the first sheet
+                    sheet_to_use = sheet_lookup.get(cat.lower(), first_sheet)
+                    if sheet_to_use is None:
+                        continue
+                    # Read the sheet's rows
                     try:
-                        df = _pd.read_excel(workbook_path, sheet_name=sheet_to_use)
+                        rows = read_sheet(sheet_to_use)
                     except Exception:
-                        df = None
-                if df is None:
-                    continue
-                # Write DataFrame to a temporary CSV file
-                tmp = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".csv", mode="w", encoding="utf-8"
-                )
-                df.to_csv(tmp.name, index=False)
-                tmp.close()
-                file_map[cat] = tmp.name
-                collect_missing_names_df(df)
-            # Perform the import
-            results = self.model.import_all(file_map)
-            # Refresh players to reflect changes
+                        continue
+                    rows_map[cat] = rows
+                    all_names.update(_table_player_names(rows))
+                try:
+                    close_workbook()
+                except Exception:
+                    pass
+                index = self.model.name_index_map
+                not_found = {
+                    name for key, name in all_names.items() if key not in index
+                }
+                # Perform the import
+                results = self.model.import_all_rows(rows_map)
+            except Exception as exc:
+                error = f"Import failed:\n{exc}"
+        self.after(
+            0, lambda: self._finish_excel_import(results, not_found, error, loading_win)
+        )
+
+    def _finish_excel_import(
+        self,
+        results: dict[str, int],
+        not_found: set[str],
+        error: str | None,
+        loading_win: tk.Toplevel,
+    ) -> None:
+        """Close the loading dialog and summarize the Excel import (Tk thread)."""
+        # Refresh players to reflect changes (on the Tk thread, see
+        # ``_finish_coy_import``)
+        if error is None:
             try:
                 self.model.refresh_players()
             except Exception:
                 pass
-        finally:
-            # Destroy the loading dialog
-            try:
-                loading_win.destroy()
-            except Exception:
-                pass
-            # Clean up temporary files
-            for p in file_map.values():
-                try:
-                    if p and os.path.isfile(p):
-                        os.remove(p)
-                except Exception:
-                    pass
+        self.scanning = False
+        # Hide the loading dialog
+        self._hide_loading_window(loading_win)
+        if error is not None:
+            messagebox.showerror("Excel Import", error)
+            return
         # Build summary message
         msg_lines = ["Excel import completed."]
         if results:
             msg_lines.append("\nPlayers updated:")
             for cat, cnt in results.items():
-                if file_map.get(cat):
-                    msg_lines.append(f"  {cat}: {cnt}")
+                msg_lines.append(f"  {cat}: {cnt}")
         # Inform about missing players
         if not_found:
             msg_lines.append("\nPlayers not found:")
@@ -3603,20 +5110,23 @@ class PlayerEditorApp(tk.Tk):
             bg="#FFFFFF",
             fg="#2F3E46",
         ).pack(pady=(5, 10))
-        # Form for each team field
-        self.team_field_vars: Dict[str, tk.StringVar] = {}
+        # Form for each team field.  The widget pairs are built up front in
+        # a flat list and then gridded in one pass.  The entries have no
+        # ``StringVar``: their text is only needed when a team is loaded or
+        # saved, so it is set and read on the widgets directly (see
+        # ``_set_team_entries``) instead of tracing a Tcl variable per field.
         form = tk.Frame(detail, bg="#FFFFFF")
         form.pack(fill=tk.X, padx=10, pady=5)
-        row = 0
-        for label in TEAM_FIELDS.keys():
-            tk.Label(form, text=f"{label}:", bg="#FFFFFF").grid(
-                row=row, column=0, sticky=tk.W, pady=2
-            )
-            var = tk.StringVar()
-            entry = tk.Entry(form, textvariable=var)
+        self.team_field_entries: Dict[str, tk.Entry] = {
+            label: tk.Entry(form) for label in TEAM_FIELDS
+        }
+        cells = [
+            (tk.Label(form, text=f"{label}:", bg="#FFFFFF"), entry)
+            for label, entry in self.team_field_entries.items()
+        ]
+        for row, (lbl, entry) in enumerate(cells):
+            lbl.grid(row=row, column=0, sticky=tk.W, pady=2)
             entry.grid(row=row, column=1, sticky=tk.EW, padx=5, pady=2)
-            self.team_field_vars[label] = var
-            row += 1
         form.columnconfigure(1, weight=1)
         # Save button
         self.btn_team_save = tk.Button(
@@ -3663,8 +5173,7 @@ class PlayerEditorApp(tk.Tk):
         team_name = self.team_edit_var.get()
         if not team_name:
             self.btn_team_save.config(state=tk.DISABLED)
-            for var in self.team_field_vars.values():
-                var.set("")
+            self._set_team_entries({})
             return
         # Find team index
         teams = self.model.get_teams()
@@ -3676,19 +5185,22 @@ class PlayerEditorApp(tk.Tk):
         fields = self.model.get_team_fields(idx)
         if fields is None:
             # Not connected or cannot read
-            for var in self.team_field_vars.values():
-                var.set("")
+            self._set_team_entries({})
             self.btn_team_save.config(state=tk.DISABLED)
             return
         # Populate fields
-        for label, var in self.team_field_vars.items():
-            val = fields.get(label, "")
-            var.set(val)
+        self._set_team_entries(fields)
         # Enable save if process open
         self.btn_team_save.config(
             state=tk.NORMAL if self.model.mem.hproc else tk.DISABLED
         )
 
+    def _set_team_entries(self, values: Mapping[str, str]) -> None:
+        """Replace the text of each team field entry (blank if not in ``values``)."""
+        for label, entry in self.team_field_entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, values.get(label, ""))
+
     def _save_team(self):
         """Save the edited team fields back to memory."""
         team_name = self.team_edit_var.get()
@@ -3699,7 +5211,9 @@ class PlayerEditorApp(tk.Tk):
             idx = teams.index(team_name)
         except ValueError:
             return
-        values = {label: var.get() for label, var in self.team_field_vars.items()}
+        values = {
+            label: entry.get() for label, entry in self.team_field_entries.items()
+        }
         ok = self.model.set_team_fields(idx, values)
         if ok:
             messagebox.showinfo("Success", f"Updated {team_name} successfully.")
@@ -3729,7 +5243,7 @@ class PlayerEditorApp(tk.Tk):
     # ---------------------------------------------------------------------
     # Scanning players
     # ---------------------------------------------------------------------
-    def _start_scan(self):
+    def _start_scan(self, force: bool = True):
         if self.scanning:
             return
         self.scanning = True
@@ -3737,10 +5251,13 @@ class PlayerEditorApp(tk.Tk):
         self.player_listbox.insert(tk.END, "Scanning players...")
         self.scan_status_label.config(text="Scanning... please wait")
         # Launch in a separate thread to avoid blocking UI
-        threading.Thread(target=self._scan_thread, daemon=True).start()
+        threading.Thread(target=self._scan_thread, args=(force,), daemon=True).start()
 
-    def _scan_thread(self):
-        self.model.refresh_players()
+    def _scan_thread(self, force: bool = True):
+        if force:
+            self.model.refresh_players()
+        else:
+            self.model.refresh_players_if_stale()
         teams = self.model.get_teams()
 
         def update_ui():
@@ -3773,6 +5290,16 @@ class PlayerEditorApp(tk.Tk):
         self.selected_player = None
         self._update_detail_fields()
 
+    def _schedule_player_filter(self, delay_ms: int = 80) -> None:
+        """Run ``_filter_player_list`` once the search text stops changing.
+
+        Every keystroke restarts the timer, so a burst of typing rebuilds
+        the list once instead of once per character.
+        """
+        if self._filter_pending is not None:
+            self.after_cancel(self._filter_pending)
+        self._filter_pending = self.after(delay_ms, self._filter_player_list)
+
     def _filter_player_list(self) -> None:
         """Filter the player list based on the search entry and repopulate the listbox.
 
@@ -3783,17 +5310,36 @@ class PlayerEditorApp(tk.Tk):
         displayed.  ``filtered_player_indices`` is updated to map each
         visible row back to the index in ``current_players``.
         """
+        if self._filter_pending is not None:
+            self.after_cancel(self._filter_pending)
+            self._filter_pending = None
         search = self.player_search_var.get().strip().lower()
         # Treat the placeholder text as an empty search
         if search == "search players…".lower():
             search = ""
+        players = self.current_players
+        if players is not self._filter_source:
+            # New roster: lower-case its names once for all later searches
+            self._filter_source = players
+            self._filter_names = [(p.full_name or "").lower() for p in players]
+            candidates = range(len(players))
+        elif search.startswith(self._last_search):
+            # The search only got longer, so rows hidden before stay hidden
+            candidates = self.filtered_player_indices
+        else:
+            candidates = range(len(players))
+        self._last_search = search
+        names = self._filter_names
+        self.filtered_player_indices = [
+            idx for idx in candidates if not search or search in names[idx]
+        ]
+        # Replace the rows with one delete and one multi-item insert rather
+        # than a Tcl call (and pending redraw) per row.
         self.player_listbox.delete(0, tk.END)
-        self.filtered_player_indices = []
-        for idx, p in enumerate(self.current_players):
-            name = (p.full_name or "").lower()
-            if not search or search in name:
-                self.filtered_player_indices.append(idx)
-                self.player_listbox.insert(tk.END, p.full_name)
+        if self.filtered_player_indices:
+            self.player_listbox.insert(
+                tk.END, *[players[idx].full_name for idx in self.filtered_player_indices]
+            )
 
     def _on_team_selected(self, _event=None):
         self._refresh_player_list()
@@ -4373,79 +5919,84 @@ class FullPlayerEditor(tk.Toplevel):
     def _load_all_values(self) -> None:
         """
         Populate all spinboxes with current values from memory.  This
-        iterates over the categories and fields stored in
-        ``self.field_vars`` and calls ``model.get_field_value`` for
-        each one.
+        collects the categories and fields stored in ``self.field_vars``
+        and decodes them all with one ``model.get_field_values`` call.
         """
         # Iterate over each category and field to load values using stored
         # metadata.  The metadata is stored in ``self.field_meta`` keyed by
-        # (category, field_name).  We then set the associated variable.
+        # (category, field_name).  All fields are decoded from a single read
+        # of the player record, then each associated variable is set.
+        entries: list[tuple[str, tk.Variable, dict]] = []
         for category, fields in self.field_vars.items():
             for field_name, var in fields.items():
                 meta = self.field_meta.get((category, field_name))
                 if not meta:
                     continue
-                offset = meta.get("offset", 0)
-                start_bit = meta.get("start_bit", 0)
-                length = meta.get("length", 0)
-                value = self.model.get_field_value(
-                    self.player.index, offset, start_bit, length
-                )
-                if value is not None:
-                    try:
-                        # Convert raw bitfield values to user‑friendly values
-                        if category in ("Attributes", "Durability"):
-                            # Map the raw bitfield value into the 25–99 rating scale
-                            rating = convert_raw_to_rating(int(value), length)
-                            var.set(int(rating))
-                        elif category == "Tendencies":
-                            # Tendencies use a 0–100 scale
-                            rating = convert_tendency_raw_to_rating(int(value), length)
-                            var.set(int(rating))
-                        elif category == "Badges":
-                            # Badges are stored as 3‑bit fields; clamp to 0–4
-                            lvl = int(value)
-                            if lvl < 0:
-                                lvl = 0
-                            elif lvl > 4:
-                                lvl = 4
-                            var.set(lvl)
-                            # Update combobox display if present
-                            widget = meta.get("widget") if meta else None
-                            if widget is not None:
-                                try:
-                                    widget.set(BADGE_LEVEL_NAMES[lvl])
-                                except Exception:
-                                    pass
-                        elif meta and isinstance(meta.get("values"), list):
-                            # Enumerated field: clamp the raw value to the index range
-                            vals = meta.get("values")
-                            idx = int(value)
-                            if idx < 0:
-                                idx = 0
-                            elif idx >= len(vals):
-                                idx = len(vals) - 1
-                            var.set(idx)
-                            # Update combobox display
-                            widget = meta.get("widget")
-                            if widget is not None:
-                                try:
-                                    widget.set(vals[idx])
-                                except Exception:
-                                    pass
-                        else:
-                            # Other categories are shown as their raw integer values
-                            var.set(int(value))
-                    except Exception:
-                        pass
+                entries.append((category, var, meta))
+        specs = [
+            (meta.get("offset", 0), meta.get("start_bit", 0), meta.get("length", 0))
+            for _, _, meta in entries
+        ]
+        values = self.model.get_field_values(self.player.index, specs)
+        for (category, var, meta), value in zip(entries, values):
+            length = meta.get("length", 0)
+            if value is not None:
+                try:
+                    # Convert raw bitfield values to user‑friendly values
+                    if category in ("Attributes", "Durability"):
+                        # Map the raw bitfield value into the 25–99 rating scale
+                        rating = convert_raw_to_rating(int(value), length)
+                        var.set(int(rating))
+                    elif category == "Tendencies":
+                        # Tendencies use a 0–100 scale
+                        rating = convert_tendency_raw_to_rating(int(value), length)
+                        var.set(int(rating))
+                    elif category == "Badges":
+                        # Badges are stored as 3‑bit fields; clamp to 0–4
+                        lvl = int(value)
+                        if lvl < 0:
+                            lvl = 0
+                        elif lvl > 4:
+                            lvl = 4
+                        var.set(lvl)
+                        # Update combobox display if present
+                        widget = meta.get("widget") if meta else None
+                        if widget is not None:
+                            try:
+                                widget.set(BADGE_LEVEL_NAMES[lvl])
+                            except Exception:
+                                pass
+                    elif meta and isinstance(meta.get("values"), list):
+                        # Enumerated field: clamp the raw value to the index range
+                        vals = meta.get("values")
+                        idx = int(value)
+                        if idx < 0:
+                            idx = 0
+                        elif idx >= len(vals):
+                            idx = len(vals) - 1
+                        var.set(idx)
+                        # Update combobox display
+                        widget = meta.get("widget")
+                        if widget is not None:
+                            try:
+                                widget.set(vals[idx])
+                            except Exception:
+                                pass
+                    else:
+                        # Other categories are shown as their raw integer values
+                        var.set(int(value))
+                except Exception:
+                    pass
 
     def _save_all(self) -> None:
         """
         Iterate over all fields and write the current values back to the
         player's record in memory.
         """
-        # Iterate similar to load
+        # Iterate similar to load, collecting the edits so they can be
+        # written with one read and as few writes as possible
         any_error = False
+        updates: list[tuple[int, int, int, int]] = []
         for category, fields in self.field_vars.items():
             for field_name, var in fields.items():
                 meta = self.field_meta.get((category, field_name))
@@ -4478,6 +6029,8 @@ class FullPlayerEditor(tk.Toplevel):
                             rating_val = float(ui_value)
                         except Exception:
                             rating_val = 0.0
+                        if math.isnan(rating_val):
+                            rating_val = 0.0
                         value_to_write = convert_rating_to_tendency_raw(
                             rating_val, length
                         )
@@ -4507,13 +6060,12 @@ class FullPlayerEditor(tk.Toplevel):
                         value_to_write = idx_val
                     else:
                         # For other categories, write the raw value directly
-                        value_to_write = ui_value
-                    if not self.model.set_field_value(
-                        self.player.index, offset, start_bit, length, value_to_write
-                    ):
-                        any_error = True
+                        value_to_write = int(ui_value)
+                    updates.append((offset, start_bit, length, value_to_write))
                 except Exception:
                     any_error = True
+        if updates and not self.model.set_field_values_bulk(self.player.index, updates):
+            any_error = True
         if any_error:
             messagebox.showerror("Save Error", "One or more fields could not be saved.")
         else:
@@ -4759,51 +6311,57 @@ class RandomizerWindow(tk.Toplevel):
             return
         # Categories we randomize
         categories = ["Attributes", "Tendencies", "Durability"]
+        # Resolve each randomized field once: its location, the rating
+        # bounds and the conversion for its category.  The bounds cannot
+        # change while this loop runs, so they are read from the Tk
+        # variables here rather than once per player.
+        plan: list[tuple] = []
+        for cat in categories:
+            # Convert ratings into raw bitfield values using the
+            # conversion for this category, chosen once per category
+            convert = (
+                convert_rating_to_tendency_raw
+                if cat == "Tendencies"
+                else convert_rating_to_raw
+            )
+            for field in self.model.categories.get(cat, []):
+                fname = field.get("name")
+                # Check that we have min/max variables for this field
+                key = (cat, fname)
+                if key not in self.min_vars or key not in self.max_vars:
+                    continue
+                # Retrieve offset info
+                offset_str = field.get("offset", "0")
+                try:
+                    if isinstance(
+                        offset_str, str
+                    ) and offset_str.lower().startswith("0x"):
+                        offset_val = int(offset_str, 16)
+                    else:
+                        offset_val = int(offset_str)
+                except Exception:
+                    offset_val = 0
+                start_bit = int(field.get("startBit", 0))
+                length = int(field.get("length", 8))
+                min_val = self.min_vars[key].get()
+                max_val = self.max_vars[key].get()
+                if min_val > max_val:
+                    min_val, max_val = max_val, min_val
+                plan.append((offset_val, start_bit, length, min_val, max_val, convert))
         updated_players = 0
+        randint = random.randint
         for team_name in selected:
             players = self.model.get_players_by_team(team_name)
             if not players:
                 continue
             for player in players:
-                player_updated = False
-                for cat in categories:
-                    fields = self.model.categories.get(cat, [])
-                    for field in fields:
-                        fname = field.get("name")
-                        # Check that we have min/max variables for this field
-                        key = (cat, fname)
-                        if key not in self.min_vars or key not in self.max_vars:
-                            continue
-                        # Retrieve offset info
-                        offset_str = field.get("offset", "0")
-                        try:
-                            if isinstance(
-                                offset_str, str
-                            ) and offset_str.lower().startswith("0x"):
-                                offset_val = int(offset_str, 16)
-                            else:
-                                offset_val = int(offset_str)
-                        except Exception:
-                            offset_val = 0
-                        start_bit = int(field.get("startBit", 0))
-                        length = int(field.get("length", 8))
-                        min_val = self.min_vars[key].get()
-                        max_val = self.max_vars[key].get()
-                        if min_val > max_val:
-                            min_val, max_val = max_val, min_val
-                        # Pick a random rating within the user‑specified bounds
-                        rating = random.randint(min_val, max_val)
-                        # Convert the rating into a raw bitfield value using
-                        # the appropriate conversion based on category
-                        if cat == "Tendencies":
-                            raw_val = convert_rating_to_tendency_raw(rating, length)
-                        else:
-                            raw_val = convert_rating_to_raw(rating, length)
-                        if self.model.set_field_value(
-                            player.index, offset_val, start_bit, length, raw_val
-                        ):
-                            player_updated = True
-                if player_updated:
+                # Pick a random rating within the user‑specified bounds for
+                # every field, then write the player's fields in one batch
+                updates = [
+                    (offset_val, start_bit, length, convert(randint(lo, hi), length))
+                    for offset_val, start_bit, length, lo, hi, convert in plan
+                ]
+                if self.model.set_field_values_bulk(player.index, updates):
                     updated_players += 1
         # Refresh player list to reflect updated values
         try:
@@ -5277,6 +6835,8 @@ class BatchEditWindow(tk.Toplevel):
                 numeric_val = float(self.value_var.get()) if self.value_var else 0
             except Exception:
                 numeric_val = 0
+            if math.isnan(numeric_val):
+                numeric_val = 0
             if category in ("Attributes", "Durability"):
                 value_to_write = convert_rating_to_raw(numeric_val, length)
             elif category == "Tendencies":
@@ -5321,20 +6881,25 @@ class BatchEditWindow(tk.Toplevel):
 class CategorySelectionDialog(tk.Toplevel):
     """
     Simple modal dialog that allows the user to select one or more categories
-    for the COY import.  Categories are presented as checkboxes.  The
-    selected categories are stored in the ``selected`` attribute after
-    ``OK`` is pressed; if cancelled, ``selected`` is ``None``.
+    for the COY and Excel imports.  Categories are presented as checkboxes.
+    ``ask`` shows the dialog modally and returns the checked categories, or
+    ``None`` if the user cancels or leaves every box unchecked; the dialog is
+    then hidden so the same instance can be asked again.
     """
 
     def __init__(self, parent: tk.Misc, categories: list[str]) -> None:
         super().__init__(parent)
         self.title("Select categories to import")
         self.resizable(False, False)
-        # Ensure the dialog appears above its parent
+        # Ensure the dialog appears above its parent.  The grab is taken and
+        # released by ``ask``.
         self.transient(parent)
-        self.grab_set()
-        # Internal storage for selected categories; None until closed
+        # Result of the current ``ask``; None if cancelled
         self.selected: list[str] | None = []
+        # Set when OK or Cancel is pressed; ``ask`` waits on it so the
+        # dialog can be hidden and shown again instead of rebuilt
+        self._answered = tk.BooleanVar(value=False)
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         # Create a label
         tk.Label(self, text="Import the following categories:").pack(
             padx=10, pady=(10, 5)
@@ -5373,12 +6938,29 @@ class CategorySelectionDialog(tk.Toplevel):
             self.selected = None
         else:
             self.selected = selected
-        self.destroy()
+        self._answered.set(True)
 
     def _on_cancel(self) -> None:
         """Cancel the dialog without selecting any categories."""
         self.selected = None
-        self.destroy()
+        self._answered.set(True)
+
+    def ask(self) -> list[str] | None:
+        """Show the dialog modally and return the selection.
+
+        Every box starts checked.  The dialog is hidden, not destroyed, once
+        the user answers, so the same instance can be asked again.
+        """
+        for var in self.var_map.values():
+            var.set(True)
+        self.selected = []
+        self._answered.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._answered)
+        self.grab_release()
+        self.withdraw()
+        return self.selected
 
 
 def main() -> None: